@@ -1,6 +1,9 @@
 """Mock documents, used for integration testing."""
 
+import re
+
 from dataclasses import dataclass, replace
+from functools import lru_cache
 from itertools import chain
 from pathlib import Path
 from typing import List, Optional, Sequence, Tuple
@@ -15,11 +18,16 @@ from bp.ocr import InputWord
 MockWord = Tuple[str, Tuple[float, float], Tuple[float, float]]
 
 
-def _input_word(mock_word: MockWord) -> InputWord:
-  bbox = BBox(
-    Interval(mock_word[1][0], mock_word[1][1]),
-    Interval(mock_word[2][0], mock_word[2][1]))
-  return InputWord(bbox, mock_word[0], None, None, None)
+# Words in a mock page are maximal runs of non-space characters.
+_WORD_PATTERN = re.compile(r'[^ ]+')
+
+
+def _scan_words(lines: Sequence[str]) -> Tuple[MockWord, ...]:
+  """The words in the given lines of a mock page, in reading order."""
+  return tuple(
+    (match.group(), match.span(), (line_no, line_no + 1))
+    for line_no, line in enumerate(lines)
+    for match in _WORD_PATTERN.finditer(line))
 
 
 @dataclass(frozen=True)
@@ -42,34 +50,27 @@ def mock_doc(pages: Sequence[str],
       examples.
     name: A name for the Document. This is mostly for logging/debugging. It
       should usually be fine to use the default.
+
+  Mock docs are cached, so identical calls share the same (immutable) Document.
   """
+  return _mock_doc(tuple(pages), name)
+
 
+@lru_cache(maxsize=None)
+def _mock_doc(pages: Tuple[str, ...], name: Optional[str]) -> Document:
   if not pages:
-    pages = [""]
+    pages = ("",)
 
   mock_pages: List[MockPage] = []
   offset = 0.0
   for page in pages:
-    mock_words: List[MockWord] = []
     lines = page.split('\n')
-    for line_no, line in enumerate(lines):
-      start: Optional[int] = None
-      for i in range(len(line) + 1):
-        if i < len(line) and line[i] != ' ':
-          if start is None:
-            start = i
-        if i == len(line) or line[i] == ' ':
-          if start is not None:
-            word = line[start:i]
-            mock_word = (
-              word,
-              (start, i),
-              (line_no, line_no + 1))
-            mock_words += [mock_word]
-            start = None
-    page_width = max(len(line) for line in lines) if lines else 0
+    mock_words = _scan_words(lines)
+    page_width = max(map(len, lines))
     mock_pages += [
-      MockPage(tuple(map(lambda W: _input_word(W), mock_words)),
+      MockPage(tuple(InputWord(BBox(Interval(x0, x1), Interval(y0, y1)),
+                               text, None, None, None)
+                     for text, (x0, x1), (y0, y1) in mock_words),
                BBox(Interval(0, page_width),
                     Interval(0 + offset, len(lines) + offset)))]
     offset += len(lines)
@@ -44,6 +44,12 @@ class TestSpatialRules(TestCase):
             extract(
               top_down('apple', 'orange', 'banana'))))
 
+    self.assertFalse(
+        no_nontrivial_extractions(
+            doc,
+            extract(
+              left_to_right('apple', 'orange', 'banana'))))
+
   def test_table(self) -> None:
     doc = mock_doc([
       """
@@ -70,12 +70,13 @@ class ExpectedExtraction:
         extraction to have extra fields set (for example, anchors) which are not
         present in this expected extraction.
     """
-    if exact and extraction.fields != self.fields:
+    dictionary = extraction.build_dictionary()
+    if exact and dictionary.keys() != self.dictionary.keys():
       return False
-    if not self.fields <= extraction.fields:
+    if not self.dictionary.keys() <= dictionary.keys():
       return False
-    return all(extraction[field].entity_text == self.dictionary[field]
-      for field in self.dictionary)
+    return all(dictionary[field].entity_text == text
+      for field, text in self.dictionary.items())
 
 
 def no_nontrivial_extractions(doc: Document, node: Node) -> bool:
@@ -84,7 +85,8 @@ def no_nontrivial_extractions(doc: Document, node: Node) -> bool:
   In other words, does this extraction tree fail to match this document at all?
   """
 
-  results = run_model(doc, node, Config(num_samples=-1))
+  results = run_model(
+    doc, node, Config(num_samples=-1, stop_on_first_nonempty=True))
   if results.root is None:
     # Extraction timed out.
     return False
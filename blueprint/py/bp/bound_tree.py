@@ -1,7 +1,7 @@
+import heapq
 import logging
 
-from dataclasses import dataclass, replace
-from itertools import chain
+from dataclasses import replace
 from typing import Callable, Collection, Dict, FrozenSet, Iterator, List, Optional, Tuple, Union
 
 from .bp_logging import bp_logging
@@ -21,9 +21,15 @@ from .spatial_formula import Conjunction, DNF, Formula, restrictive_power, simpl
 from .trivial_prefilter import TrivialPrefilter
 
 
-@dataclass
+# How many of its best extractions a bound node keeps for reporting results.
+NUM_TOP_EXTRACTIONS = 20
+
+
 class BoundNode(Iterator[ScoredExtraction]):
 
+  __slots__ = ('document', 'legal_fields', 'rules', 'name', 'uuid',
+               'best_extraction', 'num_extractions_generated', '_top_heap')
+
   def __init__(
       self,
       document: Document,
@@ -40,7 +46,10 @@ class BoundNode(Iterator[ScoredExtraction]):
 
     # Cached in _yielding.
     self.best_extraction: Optional[ScoredExtraction] = None
-    self.returned_extractions: List[ScoredExtraction] = []
+    self.num_extractions_generated = 0
+    # A min-heap of (score, -index, extraction) holding the best
+    # NUM_TOP_EXTRACTIONS extractions yielded so far; the worst one is on top.
+    self._top_heap: List[Tuple[float, int, ScoredExtraction]] = []
 
   def __next__(self) -> ScoredExtraction:
     raise NotImplementedError
@@ -56,25 +65,36 @@ class BoundNode(Iterator[ScoredExtraction]):
 
   def is_decidable(self, rule: Rule) -> bool:
     """Can this rule be checked at this node?"""
-    return frozenset(rule.fields) <= self.legal_fields
+    return self.legal_fields.issuperset(rule.fields)
 
   def _yielding(self, extraction: ScoredExtraction) -> ScoredExtraction:
     if self.best_extraction is None or extraction < self.best_extraction:
       self.best_extraction = extraction
-    self.returned_extractions.append(extraction)
+    item = (extraction.score, -self.num_extractions_generated, extraction)
+    if len(self._top_heap) < NUM_TOP_EXTRACTIONS:
+      heapq.heappush(self._top_heap, item)
+    else:
+      heapq.heappushpop(self._top_heap, item)
+    self.num_extractions_generated += 1
     return extraction
 
   @property
-  def num_extractions_generated(self) -> int:
-    return len(self.returned_extractions)
+  def top_extractions(self) -> Tuple[ScoredExtraction, ...]:
+    """The best extractions yielded so far, best first.
+
+    Ties are broken in favor of the extraction that was yielded first.
+    """
+    return tuple(extraction for _, _, extraction
+                 in sorted(self._top_heap, reverse=True))
 
   def __str__(self) -> str:
     return self.name
 
 
-@dataclass
 class BoundEmptyNode(BoundNode):
 
+  __slots__ = ()
+
   def __init__(
       self,
       document: Document,
@@ -91,9 +111,10 @@ class BoundEmptyNode(BoundNode):
     return tuple()
 
 
-@dataclass
 class BoundLeafNode(BoundNode):
 
+  __slots__ = ('field', 'extractions', 'i', '_non_atom_rules')
+
   def __init__(
       self,
       document: Document,
@@ -108,14 +129,15 @@ class BoundLeafNode(BoundNode):
     self.field = field
     self.extractions = extractions
     self.i = 0
+    self._non_atom_rules = frozenset(
+      rule for rule in rules if not isinstance(rule, Atom))
 
   def __next__(self) -> ScoredExtraction:
     while self.i < len(self.extractions):
       # TODO: Non-Atom degree-1 rules should be accounted for at binding stage
       # already; once that's the case, pass no rules here.
       extraction = merge(
-          [self.extractions[self.i]], frozenset(filter(
-            lambda R: not isinstance(R, Atom), self.rules)), self.legal_fields,
+          [self.extractions[self.i]], self._non_atom_rules, self.legal_fields,
           self.mass)
           # Degree-1 atom score results are cached -- the extractions passed to
           # BoundLeafNode's constructor should have these rules applied already.
@@ -137,8 +159,10 @@ class BoundLeafNode(BoundNode):
     return tuple()
 
 
-@dataclass
 class BoundPatternNode(BoundNode):
+
+  __slots__ = ('child',)
+
   def __init__(
       self,
       document: Document,
@@ -148,8 +172,8 @@ class BoundPatternNode(BoundNode):
       uuid: str,
   ):
     super().__init__(
-      document, frozenset(filter(lambda F: len(F) > 0 and F[0] != '_',
-        child.legal_fields)),
+      document, frozenset(F for F in child.legal_fields
+                          if len(F) > 0 and F[0] != '_'),
       rules, name, uuid)
 
     self.child = child
@@ -165,12 +189,13 @@ class BoundPatternNode(BoundNode):
 
   def public_extraction(self, scored_extraction: ScoredExtraction) \
       -> ScoredExtraction:
-    extraction = Extraction(assignments=tuple(filter(
-      lambda A: A.field in self.legal_fields,
-      scored_extraction.extraction.assignments)))
+    legal_fields = self.legal_fields
+    extraction = Extraction(assignments=tuple(
+      A for A in scored_extraction.extraction.assignments
+      if A.field in legal_fields))
     field_scores = {field: score
       for field, score in scored_extraction.field_scores.items()
-      if field in self.legal_fields}
+      if field in legal_fields}
     return replace(scored_extraction,
       extraction=extraction, field_scores=field_scores)
 
@@ -179,8 +204,10 @@ class BoundPatternNode(BoundNode):
     return (self.child,)
 
 
-@dataclass
 class BoundMergeNode(BoundNode):
+
+  __slots__ = ('child',)
+
   def __init__(
       self,
       document: Document,
@@ -206,9 +233,10 @@ class BoundMergeNode(BoundNode):
     return (self.child,)
 
 
-@dataclass
 class BoundCombineNode(BoundNode):
 
+  __slots__ = ('node1', 'node2', 'smerger')
+
   def __init__(
       self,
       document: Document,
@@ -227,14 +255,15 @@ class BoundCombineNode(BoundNode):
     self.node1 = node1
     self.node2 = node2
 
-    decidable_atoms: Tuple[Atom, ...] = tuple(filter(
-      lambda A: self.legal_fields.issuperset(A.fields),
-      chain.from_iterable(map(
-        lambda R: R.atoms if isinstance(R, Connective)
-                          else (R,), rules))))
+    fields_are_legal = self.legal_fields.issuperset
+    decidable_atoms: Tuple[Atom, ...] = tuple(
+      atom
+      for rule in rules
+      for atom in (rule.atoms if isinstance(rule, Connective) else (rule,))
+      if fields_are_legal(atom.fields))
 
     # TODO: Should we include rules from lower in the hierarchy? Potential optimization.
-    Phi = simplify(DNF(Conjunction(rule.phi for rule in decidable_atoms)))
+    Phi = simplify(DNF(Conjunction(atom.phi for atom in decidable_atoms)))
 
     def prefilter_data(
         N_target: BoundNode,
@@ -243,11 +272,13 @@ class BoundCombineNode(BoundNode):
       def phi_I(field: Field) -> Formula:
         return simplify(weaken(Phi, field, N_feeder.legal_fields))
 
+      # Weaken Phi once per candidate field; the winner's formula is reused.
+      phis = {I0: phi_I(I0) for I0 in N_target.legal_fields}
       I = arg_max(
           lambda I0: restrictive_power(
-              DNF(phi_I(I0)), I0, N_feeder.legal_fields), N_target.legal_fields)
+              DNF(phis[I0]), I0, N_feeder.legal_fields), phis)
 
-      return (I, phi_I(I))
+      return (I, phis[I])
 
     def prefilter(N_target: BoundNode, N_feeder: BoundNode) \
         -> Union[DocRegionPrefilter, TrivialPrefilter]:
@@ -261,11 +292,13 @@ class BoundCombineNode(BoundNode):
 
     def merger(Ms: Tuple[ScoredExtraction, ...]) -> Optional[ScoredExtraction]:
       assert len(Ms) == 2
+      # The merged fields are known up front, so discard partial extractions
+      # before paying for the merge.
+      if all_or_nothing:
+        fields = Ms[0].fields | Ms[1].fields
+        if fields and fields != self.legal_fields:
+          return None
       M = merge(Ms, self.rules, self.legal_fields, self.mass)
-      if all_or_nothing \
-          and frozenset(M.fields) != self.legal_fields \
-          and not M.is_empty:
-        return None
       return M if M.valid else None
 
     def norm_estimator(Ms: Tuple[ScoredExtraction, ...]) -> float:
@@ -296,9 +329,10 @@ class BoundCombineNode(BoundNode):
     return (self.node1, self.node2)
 
 
-@dataclass
 class BoundPickBestNode(BoundNode):
 
+  __slots__ = ('children', 'heap')
+
   def __init__(
       self,
       document: Document,
@@ -11,7 +11,7 @@ from typing import Any, Iterable, List, Optional, Tuple
 from .bp_logging import bp_logging
 from .document import DocRegion, Document, EZDocRegion
 from .entity import Entity, Page, Text, Word
-from .functional import take_before, without_none
+from .functional import without_none
 from .geometry import BBox, Interval
 from .ocr import InputWord
 
@@ -29,6 +29,8 @@ class InputPage:
 
 @dataclasses.dataclass
 class PageEntities:
+  __slots__ = ('words', 'maximal_phrases', 'sub_phrases', 'multiline_clusters')
+
   words: Tuple[Entity, ...]
   maximal_phrases: Tuple[Entity, ...]
   sub_phrases: Tuple[Entity, ...]
@@ -36,6 +38,8 @@ class PageEntities:
 
   @staticmethod
   def combine(page_entities: Tuple['PageEntities', ...]) -> 'PageEntities':
+    if len(page_entities) == 1:
+      return page_entities[0]
     return PageEntities(
       tuple(chain.from_iterable(P.words for P in page_entities)),
       tuple(chain.from_iterable(P.maximal_phrases for P in page_entities)),
@@ -43,6 +47,87 @@ class PageEntities:
       tuple(chain.from_iterable(P.multiline_clusters for P in page_entities)))
 
 
+def get_maximal_phrases(phrases: Tuple[Text, ...]) -> Tuple[Text, ...]:
+  return tuple(filter(lambda T: T.maximality_score == 1, phrases))
+
+
+def build_page_entities(input_page: InputPage, y_offset: float,
+    document: Document) -> PageEntities:
+  """Build the entities on a single page.
+
+  Args:
+    input_page: The page and its words, in the page's own coordinates.
+    y_offset: The total height of all previous pages in the document.
+    document: The document the page belongs to.
+  """
+  page = input_page.page
+  input_words = input_page.words
+  msrapi_lines = input_page.msrapi_lines
+
+  page_bbox = page.bbox
+
+  def make_word(input_word: InputWord) -> Optional[Word]:
+    bbox = input_word.bbox
+    input_word = dataclasses.replace(input_word, bbox=BBox(
+      bbox.ix, Interval(bbox.iy.a + y_offset, bbox.iy.b + y_offset)))
+    if not page_bbox.contains_bbox(input_word.bbox):
+      bp_logging.warning(
+        '{} not in page bounds {}; discarding'.format(input_word, page_bbox))
+      return None
+    if not input_word.text:
+      bp_logging.warning('{} has empty text; discarding'.format(input_word))
+      return None
+    return Word.from_input_word(input_word)
+
+  if msrapi_lines:
+    if input_words:
+      raise RuntimeError('Mixing MSRAPI mode with normal clustering mode')
+
+    words: List[Entity] = []
+    msrapi_line_entities: List[Entity] = []
+
+    for msrapi_line in msrapi_lines:
+      if msrapi_line:
+        if len(msrapi_line) == 1:
+          word = make_word(msrapi_line[0])
+          if word:
+            text = Text.from_words((word, ), maximality_score=1)
+            words.append(text)
+            msrapi_line_entities.append(text)
+        else:
+          words_in_line = tuple(without_none(map(make_word, msrapi_line)))
+          if len(words_in_line) == len(msrapi_line):
+            for word in words_in_line:
+              words.append(Text.from_words((word, ), maximality_score=0))
+            msrapi_line_entities.append(Text.from_words(words_in_line,
+                                                   maximality_score=1))
+          else:
+            bp_logging.warning(f'Some words from {msrapi_line} were out ' +
+                               f'of page bounds; discarding entire line')
+
+    return PageEntities(
+      tuple(words),
+      tuple(msrapi_line_entities),
+      sub_phrases=tuple(),
+      multiline_clusters=tuple())
+
+  else:
+    word_entities = tuple(without_none(map(make_word, input_words)))
+    word_texts = tuple(Text.from_words((word, )) for word in word_entities)
+    words_and_phrases = build_words_and_phrases(word_texts, page, document)
+    maximal_phrases = get_maximal_phrases(words_and_phrases)
+    scored_words = tuple(filter(lambda T: len(T.words) == 1, words_and_phrases))
+    maximal_set = frozenset(maximal_phrases)
+    sub_phrases = tuple(T for T in words_and_phrases if T not in maximal_set)
+    # Not including multiline clusters for now.
+    multiline_clusters: Tuple[Entity, ...] = tuple()
+    return PageEntities(
+      scored_words,
+      maximal_phrases,
+      sub_phrases,
+      multiline_clusters)
+
+
 def build_document(
     input_pages: Tuple[InputPage, ...], name: str) -> Document:
   """Build a Document from a tuple of pages and their words.
@@ -59,110 +144,29 @@ def build_document(
     name: The name of the document.
   """
 
-  sorted_page_numbers = tuple(
-    input_page.page.page_number for input_page in input_pages)
-
-  def y_offset(page: Page) -> float:
-    previous_pages = take_before(
-      lambda other_page: other_page == page,
-      (input_page.page for input_page in input_pages))
-    return sum(page.bbox.height for page in previous_pages)
-
-  def build_page_entities(input_page: InputPage) -> PageEntities:
-    page = input_page.page
-    input_words = input_page.words
-    msrapi_lines = input_page.msrapi_lines
-
-    def make_word(input_word: InputWord) -> Optional[Word]:
-      def offset(input_word: InputWord) -> InputWord:
-        def offset_bbox(bbox: BBox) -> BBox:
-          return BBox(
-            bbox.ix,
-            Interval(
-              bbox.iy.a + y_offset(page),
-              bbox.iy.b + y_offset(page)))
-        return dataclasses.replace(
-          input_word, bbox=offset_bbox(input_word.bbox))
-
-      input_word = offset(input_word)
-
-      def sanity_check(input_word: InputWord) -> bool:
-        if not page.bbox.contains_bbox(input_word.bbox):
-          bp_logging.warning(
-            '{} not in page bounds {}; discarding'.format(input_word, page.bbox))
-          return False
-        if not input_word.text:
-          bp_logging.warning('{} has empty text; discarding'.format(input_word))
-          return False
-        return True
-
-      if sanity_check(input_word):
-        return Word.from_input_word(input_word)
-      else:
-        return None
-
-    if msrapi_lines:
-      if input_words:
-        raise RuntimeError('Mixing MSRAPI mode with normal clustering mode')
-
-      words: List[Entity] = []
-      msrapi_line_entities: List[Entity] = []
-
-      for msrapi_line in msrapi_lines:
-        if msrapi_line:
-          if len(msrapi_line) == 1:
-            word = make_word(msrapi_line[0])
-            if word:
-              text = Text.from_words((word, ), maximality_score=1)
-              words.append(text)
-              msrapi_line_entities.append(text)
-          else:
-            words_in_line = tuple(without_none(map(make_word, msrapi_line)))
-            if len(words_in_line) == len(msrapi_line):
-              for word in words_in_line:
-                words.append(Text.from_words((word, ), maximality_score=0))
-              msrapi_line_entities.append(Text.from_words(words_in_line,
-                                                     maximality_score=1))
-            else:
-              bp_logging.warning(f'Some words from {msrapi_line} were out ' +
-                                 f'of page bounds; discarding entire line')
-
-      return PageEntities(
-        tuple(words),
-        tuple(msrapi_line_entities),
-        sub_phrases=tuple(),
-        multiline_clusters=tuple())
-
-    else:
-      word_entities = tuple(without_none(map(make_word, input_words)))
-      word_texts = tuple(Text.from_words((word, )) for word in word_entities)
-      words_and_phrases = build_words_and_phrases(word_texts, page, document)
-      maximal_phrases = get_maximal_phrases(words_and_phrases)
-      scored_words = tuple(filter(lambda T: len(T.words) == 1, words_and_phrases))
-      sub_phrases = tuple(frozenset(words_and_phrases) - frozenset(maximal_phrases))
-      # Not including multiline clusters for now.
-      multiline_clusters: Tuple[Entity, ...] = tuple()
-      return PageEntities(
-        scored_words,
-        maximal_phrases,
-        sub_phrases,
-        multiline_clusters)
-
-  def get_maximal_phrases(phrases: Tuple[Text, ...]) -> Tuple[Text, ...]:
-    return tuple(filter(lambda T: T.maximality_score == 1, phrases))
+  # The y-offset of each page is the total height of the pages before it.
+  y_offsets: List[float] = []
+  total_height: float = 0
+  for input_page in input_pages:
+    y_offsets.append(total_height)
+    total_height += input_page.page.bbox.height
 
   document = Document.from_entities(
     (input_page.page for input_page in input_pages), name=name)
 
-  page_numbers = tuple(input_page.page.page_number for input_page in input_pages)
+  # Pages are built in-process: entities compare by identity and hold
+  # references to the document, so they cannot round-trip through pickling.
   page_entities = PageEntities.combine(tuple(
-    build_page_entities(input_page) for input_page in input_pages))
-  entity_pool = tuple(frozenset(
-    tuple(chain(page_entities.words, page_entities.maximal_phrases,
-      page_entities.sub_phrases))))
-
-  dollar_amounts = tuple(frozenset(get_dollar_amounts(entity_pool)))
-  dates = tuple(frozenset(get_dates(entity_pool)))
+    build_page_entities(input_page, y_offset, document)
+    for input_page, y_offset in zip(input_pages, y_offsets)))
+  # Single-word texts appear both in words and in the (maximal or sub)
+  # phrases, so this still needs deduplicating.
+  entity_pool = tuple(dict.fromkeys(chain(page_entities.words,
+    page_entities.maximal_phrases, page_entities.sub_phrases)))
+
+  # Each date and dollar amount is a new entity, so these need no deduplication.
+  dollar_amounts = get_dollar_amounts(entity_pool)
+  dates = get_dates(entity_pool)
 
   return document.with_entities(
     frozenset(chain(page_entities.words, page_entities.maximal_phrases,
@@ -3,12 +3,12 @@
 import os
 
 from argparse import _SubParsersAction, Namespace
-from concurrent.futures import FIRST_EXCEPTION, ProcessPoolExecutor, wait
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
 from dataclasses import asdict, dataclass, replace
-from itertools import chain
+from itertools import chain, islice
 from multiprocessing import Manager
 from pathlib import Path
-from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Tuple
 
 from ..bound_tree import BoundNode
 from ..bp_logging import bp_logging, configure_cli_logging
@@ -85,28 +85,33 @@ def main_run_model(args: Namespace) -> None:
         return path.parent / file_path
     return list(map(compute_path, file_paths))
 
-  docs: Tuple[Document, ...] = tuple()
+  # Documents are loaded lazily in the worker processes, so only the loader and
+  # the path need to be sent over.
+  DocSource = Tuple[Callable[[Path], Document], Path]
+
   if args.bundle:
-    doc_path = Path(args.bundle) / Path('selectedDoc.json')
-    if not doc_path.is_file():
+    bundle_doc_path = Path(args.bundle) / Path('selectedDoc.json')
+    if not bundle_doc_path.is_file():
       raise RuntimeError('invalid bundle; missing selectedDoc.json')
-    docs += (load_doc(doc_path),)
-  if args.doc_jsons:
-    doc_paths = [Path(p) for p in args.doc_jsons]
-    docs += tuple(load_doc(path) for path in doc_paths)
-  if args.doc_jsons_list:
-    doc_paths = read_paths_from_file(Path(args.doc_jsons_list))
-    docs += tuple(load_doc(path) for path in doc_paths)
-
-  if args.google_ocr_jsons:
-    docs += tuple(load_doc_from_google_ocr(Path(path))
+
+  def iter_doc_sources() -> Iterator[DocSource]:
+    if args.bundle:
+      yield load_doc, bundle_doc_path
+    if args.doc_jsons:
+      yield from ((load_doc, Path(path)) for path in args.doc_jsons)
+    if args.doc_jsons_list:
+      yield from ((load_doc, path)
+        for path in read_paths_from_file(Path(args.doc_jsons_list)))
+
+    if args.google_ocr_jsons:
+      yield from ((load_doc_from_google_ocr, Path(path))
                   for path in args.google_ocr_jsons)
-  if args.tesseract_hocrs:
-    docs += tuple(load_doc_from_hocr(Path(path))
-      for path in args.tesseract_hocrs)
-  if args.ibocr_jsons:
-    docs += tuple(load_doc_from_ibocr(Path(path))
-      for path in args.ibocr_jsons)
+    if args.tesseract_hocrs:
+      yield from ((load_doc_from_hocr, Path(path))
+        for path in args.tesseract_hocrs)
+    if args.ibocr_jsons:
+      yield from ((load_doc_from_ibocr, Path(path))
+        for path in args.ibocr_jsons)
 
   # Set up the output directory
   # ===========================
@@ -120,31 +125,68 @@ def main_run_model(args: Namespace) -> None:
 
   bp_logging.info('Processing documents')
 
-  for doc in docs:
-
-    # Process this doc
-    # ================
-
-    # Run extraction
-    # --------------
+  # The model and config are handed to each worker once, through the
+  # initializer, rather than being pickled with every document. Each document
+  # is still bounded by config.timeout inside run_model.
+  #
+  # Only a bounded number of documents is in flight at once, and the window is
+  # topped up as each one finishes. The first failure cancels the documents
+  # that have not started, stops any further submissions and is re-raised.
+  max_in_flight = 2 * args.num_subprocesses
+  doc_sources = iter_doc_sources()
+  with ProcessPoolExecutor(max_workers=args.num_subprocesses,
+      initializer=_init_worker, initargs=(root, config, output_dir)) \
+      as executor:
+    in_flight = {executor.submit(_process_doc, load, path)
+      for load, path in islice(doc_sources, max_in_flight)}
+    while in_flight:
+      done, in_flight = wait(in_flight, return_when=FIRST_COMPLETED)
+      for future in done:
+        if future.exception() is not None:
+          for pending in in_flight:
+            pending.cancel()
+        # Re-raises the failure, if any.
+        future.result()
+      in_flight |= {executor.submit(_process_doc, load, path)
+        for load, path in islice(doc_sources, len(done))}
+
+
+_worker_state: Optional[Tuple[Node, Config, Optional[Path]]] = None
+
+
+def _init_worker(root: Node, config: Config, output_dir: Optional[Path]) \
+    -> None:
+  global _worker_state
+  _worker_state = (root, config, output_dir)
+
+
+def _process_doc(load: Callable[[Path], Document], path: Path) -> None:
+  """Loads, runs and writes output for a single document in a worker."""
+  assert _worker_state is not None
+  root, config, output_dir = _worker_state
+
+  doc = load(path)
+
+  # Run extraction
+  # --------------
+
+  bp_logging.info(f'Processing {doc.name}')
+  results = run_model(doc, root, config)
+
+  # Write output for this doc
+  # -------------------------
 
-    bp_logging.info(f'Processing {doc.name}')
-    results = run_model(doc, root, config)
-
-    # Write output for this doc
-    # -------------------------
-
-    if output_dir:
-      bp_logging.info(f'Writing output for {doc.name}')
+  if output_dir:
+    bp_logging.info(f'Writing output for {doc.name}')
 
-      # FIXME: doc.name doesn't really mean 'name' anymore.
-      doc_name = doc.name.split('/')[-1]
-      result_path = output_dir / Path(doc_name)
-      if not str(result_path).lower().endswith('.json'):
-        result_path = Path(str(result_path) + '.json')
-      bp_logging.debug(f'Output file path: {result_path}')
+    # FIXME: doc.name doesn't really mean 'name' anymore.
+    doc_name = doc.name.split('/')[-1]
+    result_path = output_dir / Path(doc_name)
+    if not str(result_path).lower().endswith('.json'):
+      result_path = Path(str(result_path) + '.json')
+    bp_logging.debug(f'Output file path: {result_path}')
 
-      save_results(results, result_path)
+    save_results(results, result_path)
 
 
 def init_run_model(subparsers: _SubParsersAction) -> None:
@@ -6,29 +6,32 @@ different revisions of Blueprint for overall runtime and accuracy.
 
 import dataclasses
 
-from functools import reduce
-from itertools import count
+from itertools import chain, count
 from typing import Any, Dict, Iterable, List, Sequence, Tuple
 
-from .functional import all_equal, nonempty
+from .frozen_slots import FrozenSlots
+from .functional import all_equal
 
 
 def tabulate(rows_: Iterable[Iterable[Any]]) -> str:
   def render(t: Any) -> str:
     return str(t) if t is not None else ''
   rows = tuple(tuple(render(t) for t in row) for row in rows_)
-  nonempty_rows = tuple(filter(nonempty, rows))
-  maximal_rows = tuple(row for row in rows
-    if len(row) == max(map(len, rows)))
-  if not nonempty_rows: return ''
-  widths = tuple(max(len(entry) for entry in col) for col in zip(*maximal_rows))
+  if not any(rows): return ''
+  # Column widths are taken from the longest rows only.
+  max_len = max(map(len, rows))
+  widths = [0] * max_len
+  for row in rows:
+    if len(row) == max_len:
+      for i, entry in enumerate(row):
+        widths[i] = max(widths[i], len(entry))
   def make_line(row: Tuple[str, ...]) -> str:
     return '  '.join(word.ljust(width) for word, width in zip(row, widths))
   return '\n'.join(make_line(row) for row in rows)
 
 
 @dataclasses.dataclass(frozen=True)
-class Row:
+class Row(FrozenSlots):
   """A single tabular row in a comparison table.
 
   For example, in targets comparison, this is either the "extracted" row or the
@@ -39,12 +42,14 @@ class Row:
     dictionary: Key-to-value dictionary.
   """
 
+  __slots__ = ('name', 'dictionary')
+
   name: str
   dictionary: Dict[str, str]
 
 
 @dataclasses.dataclass(frozen=True)
-class Cluster:
+class Cluster(FrozenSlots):
   """A "cluster" of rows in a comparison table.
 
   For example, in targets comparison, we have one "cluster" per document.
@@ -56,6 +61,8 @@ class Cluster:
     checkmarks: Whether to put a checkmark in the given column.
   """
 
+  __slots__ = ('heading', 'rows', 'checkmarks')
+
   heading: Tuple[Tuple[str, str], ...]
   rows: Tuple[Row, ...]
   checkmarks: Dict[str, bool]
@@ -76,8 +83,8 @@ def render_cluster(cluster: Cluster, keys: Iterable[str]) -> List[List[str]]:
 
 def render_clusters(clusters: Iterable[Cluster], keys: Iterable[str]) -> str:
   keys = tuple(keys)
-  rows: List[List[str]] = reduce(
-    list.__add__, (render_cluster(cluster, keys) for cluster in clusters), [])
+  rows: List[List[str]] = list(chain.from_iterable(
+    render_cluster(cluster, keys) for cluster in clusters))
   return tabulate(rows)
 
 
@@ -85,8 +92,7 @@ def draw_table(rows: Sequence[Sequence[str]]) -> str:
   if not all_equal(map(len, rows)):
     raise ValueError('all rows must have same number of entries')
 
-  cols = tuple(zip(*rows))
-  col_widths = tuple(max(len(entry) for entry in col) for col in cols)
+  col_widths = tuple(max(map(len, col)) for col in zip(*rows))
 
   def draw_row(row: Sequence[str]) -> str:
     def justify(s: str, width: int, index: int) -> str:
@@ -19,10 +19,14 @@ class Config:
       extraction tree until we exhaust it.
     timeout: Timeout in seconds for a model run. To indicate no timeout, set
       to -1.
+    stop_on_first_nonempty: Stop sampling as soon as the extraction tree
+      yields a non-empty extraction with a positive score. This is useful when
+      we only want to know whether a model matches a document at all.
   """
 
   num_samples: int = 1
   timeout: int = -1
+  stop_on_first_nonempty: bool = False
 
 
 def load_config(path: Path) -> Config:
@@ -17,12 +17,7 @@ class DocRegionPrefilter:
     self.phi = DNF(simplify(phi))
     self.document = document
 
-    def get_doc_region(extraction: ScoredExtraction) -> DocRegion:
-      doc_region = DocRegion.build(self.document, extraction[field].bbox)
-      assert doc_region
-      return doc_region
-
-    self.ez_doc_region = EZDocRegion(get_doc_region)
+    self.ez_doc_region = EZDocRegion(self._get_doc_region)
     self.nones: List[ScoredExtraction] = []
 
     self.doc_region_terms = frozenset(doc_region_terms_with_multiplicity(phi))
@@ -42,6 +37,11 @@ class DocRegionPrefilter:
     else:
       self.ez_doc_region.insert(M_target)
 
+  def _get_doc_region(self, extraction: ScoredExtraction) -> DocRegion:
+    doc_region = DocRegion.build(self.document, extraction[self.field].bbox)
+    assert doc_region
+    return doc_region
+
   def get(self,
           M_feeder: ScoredExtraction) -> Generator[ScoredExtraction, None, None]:
     yield from self._get_from_ez_doc_region(M_feeder)
@@ -65,13 +65,18 @@ class DocRegionPrefilter:
       for conjunction in dnf.conjunctions:
         if conjunction.superset is None:
           assert conjunction.intersection_sets is not None
-          intersecting_ts = tuple(frozenset(
-              self.ez_doc_region.ts_intersecting(intersection_set))
-            for intersection_set in conjunction.intersection_sets)
-          if len(intersecting_ts) == 0:
+          if len(conjunction.intersection_sets) == 0:
             continue
-          for M0 in frozenset.intersection(*intersecting_ts):
-            M_targets.add(M0)
+          # Narrow down one intersection set at a time, and stop querying the
+          # index as soon as nothing is left.
+          first, *rest = conjunction.intersection_sets
+          intersecting = set(self.ez_doc_region.ts_intersecting(first))
+          for intersection_set in rest:
+            if not intersecting:
+              break
+            intersecting.intersection_update(
+              self.ez_doc_region.ts_intersecting(intersection_set))
+          M_targets.update(intersecting)
         elif conjunction.intersection_sets is None:
           assert conjunction.superset is not None
           for M0 in self.ez_doc_region.ts_contained_in(conjunction.superset):
@@ -80,10 +85,11 @@ class DocRegionPrefilter:
           assert all(conjunction.superset.contains_doc_region(intersection_set)
               for intersection_set in conjunction.intersection_sets)
           for M0 in self.ez_doc_region.ts_contained_in(conjunction.superset):
-            doc_region = DocRegion.build(self.document, M0[self.field].bbox)
-            assert doc_region
-            if all(intersection_set.intersects_doc_region(doc_region)
-                for intersection_set in conjunction.intersection_sets):
+            doc_region = self._get_doc_region(M0)
+            for intersection_set in conjunction.intersection_sets:
+              if not intersection_set.intersects_doc_region(doc_region):
+                break
+            else:
               M_targets.add(M0)
 
       yield from M_targets
@@ -1,16 +1,17 @@
 import functools
 
 from dataclasses import dataclass
-from typing import Callable, FrozenSet, Generator, List, Optional, Tuple, Union
+from typing import Callable, Dict, FrozenSet, Generator, List, Optional, Tuple, Union
 
 from .document import DocRegion, Document
 from .extraction import Field
+from .frozen_slots import FrozenSlots
 from .scoring import ScoredExtraction
 from .spatial_formula import Conjunction, DocRegionTerm, Disjunction, Intersect, IsContained, Literal, Formula
 
 
 @dataclass(frozen=True)
-class _Conjunction:
+class _Conjunction(FrozenSlots):
   """State that a document region is a subset of the given superset (if present)
   and meets the all of the intersection sets (if present).
 
@@ -20,18 +21,56 @@ class _Conjunction:
   Either one of these is set, or both are. If both are, each intersection set
   is a subset of superset.
   """
+  __slots__ = ('superset', 'intersection_sets')
+
   superset: Optional[DocRegion]
   intersection_sets: Optional[Tuple[DocRegion, ...]]
 
 
 @dataclass(frozen=True)
-class DocRegionRestriction:
+class DocRegionRestriction(FrozenSlots):
   """Describe a document region in disjunctive normal form."""
 
+  __slots__ = ('conjunctions',)
+
   # These are the terms of a disjunction.
   conjunctions: Tuple[_Conjunction, ...]
 
 
+def _literal_cost(literal: Literal) -> int:
+  """Orders a conjunction's literals so that those which can rule it out most
+  cheaply are processed first. The sort is stable, so intersection sets keep
+  their relative order."""
+  if isinstance(literal, bool):
+    return 0
+  if isinstance(literal, IsContained):
+    return 1
+  return 2
+
+
+# The prefilter evaluates the same phi against every feeder extraction, so the
+# parts of the evaluation that only depend on phi and field are computed once.
+
+@functools.lru_cache(maxsize=1024)
+def _sorted_conjunctions(phi: Disjunction[Conjunction[Literal]]) \
+    -> Tuple[Tuple[Literal, ...], ...]:
+  return tuple(tuple(sorted(conjunction.formulas, key=_literal_cost))
+    for conjunction in phi.formulas)
+
+
+@functools.lru_cache(maxsize=4096)
+def _split_intersect_terms(field: Field, intersect: Intersect) \
+    -> Tuple[Tuple[DocRegionTerm, ...], Tuple[DocRegionTerm, ...]]:
+  """Returns the terms of intersect over field, and the terms over other
+  fields."""
+  field_terms: List[DocRegionTerm] = []
+  non_field_terms: List[DocRegionTerm] = []
+  for term in intersect.terms:
+    (field_terms if term.field == field else non_field_terms).append(term)
+  assert all(term.transformation is None for term in field_terms)
+  return tuple(field_terms), tuple(non_field_terms)
+
+
 def get_doc_region_restriction(field: Field,
                                M_feeder: ScoredExtraction,
                                phi: Disjunction[Conjunction[Literal]],
@@ -44,26 +83,36 @@ def get_doc_region_restriction(field: Field,
   that extraction[field].doc_region is a subset of a fixed document region, or
   that it intersects a fixed document region."""
 
+  # M_feeder.fields rebuilds a frozenset on each access.
+  feeder_fields = M_feeder.fields
+
+  # The same terms, and the same fields, recur across the conjunctions of phi,
+  # so their doc regions are computed once per call.
+  field_doc_regions: Dict[Field, DocRegion] = {}
+  term_doc_regions: Dict[DocRegionTerm, Optional[DocRegion]] = {}
+
   def get_doc_region(term: DocRegionTerm) -> Union[Optional[DocRegion]]:
     """A return value of None here means 'empty set'."""
-    doc_region = DocRegion.build(document, M_feeder[term.field].bbox)
-    assert doc_region
-    if term.transformation is not None:
-      return term.transformation(doc_region)
-    return doc_region
+    if term in term_doc_regions:
+      return term_doc_regions[term]
+    doc_region = field_doc_regions.get(term.field)
+    if doc_region is None:
+      doc_region = DocRegion.build(document, M_feeder[term.field].bbox)
+      assert doc_region
+      field_doc_regions[term.field] = doc_region
+    result = term.transformation(doc_region) \
+      if term.transformation is not None else doc_region
+    term_doc_regions[term] = result
+    return result
 
   def process_intersect(intersect: Intersect) -> Union[DocRegion, bool]:
-    non_field_terms = tuple(
-        filter(lambda term: term.field != field, intersect.terms))
-    field_terms = tuple(
-        filter(lambda term: term.field == field, intersect.terms))
-    assert all(term.transformation is None for term in field_terms)
+    field_terms, non_field_terms = _split_intersect_terms(field, intersect)
 
     # For any field mapped to None, any term involving it is True by convention.
     # FIXME: These types should be more explicit. None is overloaded a lot in this logic.
     # FIXME: It would be cleaner for get_doc_region to return an ANYTHING literal.
     non_field_terms = tuple(
-        filter(lambda term: term.field in M_feeder.fields, non_field_terms))
+        term for term in non_field_terms if term.field in feeder_fields)
 
     if field_terms and not non_field_terms:
       return True
@@ -86,7 +135,7 @@ def get_doc_region_restriction(field: Field,
     for field0 in (is_contained.lhs.field, is_contained.rhs.field):
       if field0 == field:
         continue
-      if field0 not in M_feeder.fields:
+      if field0 not in feeder_fields:
         return True
 
     rhs = get_doc_region(is_contained.rhs)
@@ -103,57 +152,51 @@ def get_doc_region_restriction(field: Field,
       return rhs.contains_doc_region(lhs)
 
   def process_conjunction(
-      conjunction: Conjunction[Literal]) -> Union[_Conjunction, bool]:
+      literals: Tuple[Literal, ...]) -> Union[_Conjunction, bool]:
     """The logic of this method is very confusing."""
 
     superset: Optional[DocRegion] = None
-    intersection_sets: Optional[Tuple[DocRegion, ...]] = None
+    intersection_sets: List[DocRegion] = []
 
-    for literal in conjunction.formulas:
-      if isinstance(literal, bool):
-        if literal is False:
-          return False
+    # True and False are singletons, so identity checks distinguish them from
+    # doc regions without going through isinstance.
+    for literal in literals:
+      if literal is False:
+        return False
+      elif literal is True:
+        continue
       elif isinstance(literal, Intersect):
         result = process_intersect(literal)
-        if isinstance(result, bool):
-          if result is False:
+        if result is False:
+          return False
+        elif result is not True:
+          # IsContained literals sort first, so the superset is final here.
+          intersection_set = DocRegion.intersect_two(superset, result) \
+            if superset is not None else result
+          if intersection_set is None:
             return False
-        else:
-          if intersection_sets is None:
-            intersection_sets = (result,)
-          else:
-            intersection_sets += (result,)
+          intersection_sets.append(intersection_set)
       elif isinstance(literal, IsContained):
         result = process_is_contained(literal)
-        if isinstance(result, bool):
-          if result is False:
-            return False
-        else:
+        if result is False:
+          return False
+        elif result is not True:
           if superset is None:
             superset = result
           else:
-            superset = DocRegion.intersection([superset, result])
+            superset = DocRegion.intersect_two(superset, result)
             # FIXME: This is super confusing.
             if superset is None:
               return False
 
-    if superset is not None and intersection_sets is not None:
-      intersection_sets_ = tuple(DocRegion.intersection(
-        [superset, intersection_set]) for intersection_set in intersection_sets)
-      if any(intersection_set is None
-          for intersection_set in intersection_sets_):
-        return False
-      intersection_sets = tuple(intersection_set
-        for intersection_set in intersection_sets_
-        if intersection_set is not None)
-
-    if superset is None and intersection_sets is None:
+    if superset is None and not intersection_sets:
       return True
 
-    return _Conjunction(superset, intersection_sets)
+    return _Conjunction(
+      superset, tuple(intersection_sets) if intersection_sets else None)
 
   conjunctions: List[_Conjunction] = []
-  for conjunction in map(process_conjunction, phi.formulas):
+  for conjunction in map(process_conjunction, _sorted_conjunctions(phi)):
     if conjunction is True:
       return True
     if conjunction is False:
@@ -4,6 +4,7 @@ from functools import lru_cache
 from dataclasses import asdict, dataclass, field, replace
 from itertools import chain
 from pathlib import Path
+from statistics import median
 from typing import (
   Any,
   Callable,
@@ -20,9 +21,11 @@ from typing import (
 
 from .entity import Entity, Page, Text, Word, entity_resolver
 from .ez_box import EZBox
+from .frozen_slots import FrozenSlots
 from .functional import all_equal, arg_max, comma_sep, pairs
 from .geometry import BBox, Interval
-from .instantiate import instantiate
+from .instantiate import instantiate, to_json_value
+from .packed_rtree import PackedRTree
 from .typing_utils import unwrap
 
 
@@ -32,8 +35,11 @@ Field = str
 
 
 @dataclass(frozen=True)
-class Document:
+class Document(FrozenSlots):
   """A Document is a collection of Entities of varying type."""
+  # _entities_by_type is not a field; it caches filter_entities results.
+  __slots__ = ('bbox', 'entities', 'name', '_entities_by_type')
+
   bbox: BBox
   entities: Tuple[Entity, ...]
   name: str
@@ -52,8 +58,20 @@ class Document:
     return Document.from_entities(
       tuple(chain(self.entities, entities)), self.name)
 
-  def filter_entities(self, entity_type: Type[E]) -> Iterable[E]:
-    yield from (e for e in self.entities if isinstance(e, entity_type))
+  def filter_entities(self, entity_type: Type[E]) -> Tuple[E, ...]:
+    """Returns the entities that are instances of entity_type.
+
+    Each type's entities are found once per document and then cached.
+    """
+    try:
+      by_type = self._entities_by_type # type: ignore
+    except AttributeError:
+      by_type = {}
+      object.__setattr__(self, '_entities_by_type', by_type)
+    if entity_type not in by_type:
+      by_type[entity_type] = tuple(
+        e for e in self.entities if isinstance(e, entity_type))
+    return by_type[entity_type]
 
   @lru_cache(maxsize=None)
   def median_line_height(self) -> float:
@@ -69,17 +87,14 @@ class Document:
 
 
 def median_word_height(words: Iterable[Word]) -> float:
-  L = sorted(words, key=lambda W: W.height)
-  if not L:
+  heights = [W.height for W in words]
+  if not heights:
     return 0
-  n = len(L)
-  if n % 2 == 0:
-    return 0.5 * (L[n // 2 - 1].height + L[n // 2].height)
-  return L[(n - 1) // 2].height
+  return median(heights)
 
 
 @dataclass(frozen=True)
-class DocRegion:
+class DocRegion(FrozenSlots):
   """A region of a document.
 
   Attributes:
@@ -87,6 +102,8 @@ class DocRegion:
     bbox: A bounding box on the document.
   """
 
+  __slots__ = ('document', 'bbox')
+
   document: Document
   bbox: BBox
 
@@ -107,6 +124,22 @@ class DocRegion:
       if document is not None and bbox is not None \
       else None
 
+  @staticmethod
+  def intersect_two(dr1: Optional['DocRegion'], dr2: Optional['DocRegion']) \
+      -> Optional['DocRegion']:
+    """Equivalent to DocRegion.intersection([dr1, dr2]), without the generic
+    iterable handling; this is the common case when refining regions."""
+    if dr1 is None or dr2 is None:
+      return None
+    ix1, iy1, ix2, iy2 = dr1.bbox.ix, dr1.bbox.iy, dr2.bbox.ix, dr2.bbox.iy
+    x0 = ix1.a if ix1.a > ix2.a else ix2.a
+    x1 = ix1.b if ix1.b < ix2.b else ix2.b
+    y0 = iy1.a if iy1.a > iy2.a else iy2.a
+    y1 = iy1.b if iy1.b < iy2.b else iy2.b
+    if x0 > x1 or y0 > y1:
+      return None
+    return DocRegion(dr1.document, BBox(Interval(x0, x1), Interval(y0, y1)))
+
   @staticmethod
   def intersection(drs: Iterable[Optional['DocRegion']]) \
       -> Optional['DocRegion']:
@@ -154,9 +187,30 @@ class EZDocRegion(Generic[T]):
       yield from self.ez_box.ts_intersecting(doc_region.bbox)
 
 
-@lru_cache(maxsize=None)
+class PackedDocRegion(Generic[T]):
+  """Like EZDocRegion, but for a collection of ts known up front.
+
+  The ts are bulk-loaded into a PackedRTree, which is faster to query than an
+  EZBox but cannot be inserted into.
+  """
+
+  def __init__(
+      self, ts: Iterable[T], doc_region_getter: Callable[[T], DocRegion]):
+    self.packed_rtree: PackedRTree[T] = PackedRTree(
+      ts, lambda t: doc_region_getter(t).bbox)
+
+  def ts(self) -> Generator[T, None, None]:
+    yield from self.packed_rtree.ts()
+
+  def ts_contained_in(self, doc_region: DocRegion) -> Generator[T, None, None]:
+    yield from self.packed_rtree.ts_contained_in(doc_region.bbox)
+
+  def ts_intersecting(self, doc_region: DocRegion) -> Generator[T, None, None]:
+    yield from self.packed_rtree.ts_intersecting(doc_region.bbox)
+
+
 def get_document_pages(document: Document) -> Tuple[Page, ...]:
-  return tuple(filter(lambda E: isinstance(E, Page), document.entities)) # type: ignore
+  return document.filter_entities(Page)
 
 
 def get_pages(entity: Entity, document: Document) -> Tuple[Page, ...]:
@@ -165,16 +219,14 @@ def get_pages(entity: Entity, document: Document) -> Tuple[Page, ...]:
 
 
 @lru_cache(maxsize=None)
-def build_words_ez_doc_region(document: Document) -> EZDocRegion[Entity]:
+def build_words_ez_doc_region(document: Document) -> PackedDocRegion[Entity]:
   def build_doc_region(E: Entity) -> DocRegion:
     doc_region = DocRegion.build(document, E.bbox)
     assert doc_region
     return doc_region
-  ez_doc_region: EZDocRegion[Entity] = EZDocRegion(build_doc_region)
-  for word in filter(lambda E: isinstance(E, Text)
-                                and len(E.words) == 1, document.entities):
-    ez_doc_region.insert(word)
-  return ez_doc_region
+  return PackedDocRegion(
+    (text for text in document.filter_entities(Text) if len(text.words) == 1),
+    build_doc_region)
 
 
 @lru_cache(maxsize=None)
@@ -199,7 +251,7 @@ def load_doc(path: Path) -> Document:
 
 
 def dump_to_json(root: Document) -> str:
-  return json.dumps(asdict(root))
+  return json.dumps(to_json_value(root))
 
 
 def save_doc(root: Document, path: Path) -> None:
@@ -6,14 +6,18 @@ from dataclasses import asdict, dataclass, fields
 from itertools import chain
 from typing import Any, Dict, Generic, Iterable, Optional, Tuple, Type
 
+from .frozen_slots import FrozenSlots
 from .geometry import BBox
-from .instantiate import instantiate
+from .instantiate import instantiate, to_json_value
 from .ocr import InputWord
 from .typing_utils import assert_exhaustive, unwrap
 
 
 @dataclass(frozen=True)
-class Entity:
+class Entity(FrozenSlots):
+  # _entity_words is not a field; it caches entity_words() once computed.
+  __slots__ = ('bbox', 'type', '_entity_words')
+
   bbox: BBox
   type: str
 
@@ -38,16 +42,23 @@ class Entity:
     raise NotImplementedError
 
   def entity_words(self) -> Iterable['Word']:
-    """Yields all Word entities among this entity's children.
+    """Returns all Word entities among this entity's children.
 
     Can be seen as returning an iterator over the leaves of this
-    Entity's DAG.
+    Entity's DAG. Entities are immutable, so the DAG is only walked once per
+    entity.
 
     If this Entity is a Word, yields itself.
 
     STRONGLY RECOMMENDED not to override this.
     """
-    yield from chain.from_iterable(E.entity_words() for E in self.children)
+    try:
+      return self._entity_words # type: ignore
+    except AttributeError:
+      words = tuple(chain.from_iterable(
+        E.entity_words() for E in self.children))
+      object.__setattr__(self, '_entity_words', words)
+      return words
 
   @property
   def entity_text(self) -> Optional[str]:
@@ -69,6 +80,8 @@ class Page(Entity):
   pages on top of each other would put page 2's bbox as:
       top_left: (0, 100), bottom_right: (50, 200)
   """
+  __slots__ = ('page_number',)
+
   page_number: int
 
   def __init__(
@@ -94,6 +107,8 @@ class Page(Entity):
 
 @dataclass(frozen=True)
 class Word(Entity):
+  __slots__ = ('text', 'origin')
+
   text: str
   origin: Optional[InputWord]
 
@@ -122,16 +137,18 @@ class Word(Entity):
     yield from []
 
   def entity_words(self) -> Iterable['Word']:
-    """Yields itself.
+    """Returns just itself.
 
     This provides the base case for Entity.words.
     """
-    yield self
+    return (self,)
 
 
 @dataclass(frozen=True)
 class Text(Entity):
   """A sequence of one or more contiguous words."""
+  __slots__ = ('text', 'words', 'maximality_score', 'ocr_score')
+
   text: str
   words: Tuple[Word, ...]
   maximality_score: Optional[float]
@@ -174,6 +191,8 @@ class Text(Entity):
 
 @dataclass(frozen=True)
 class Cluster(Entity):
+  __slots__ = ('text', 'lines', 'label')
+
   text: str
   lines: Tuple[Text, ...]
   label: Optional[str]
@@ -208,6 +227,8 @@ class Cluster(Entity):
 
 @dataclass(frozen=True)
 class Date(Entity):
+  __slots__ = ('text', 'words', 'likeness_score')
+
   text: str
   words: Tuple[Word, ...]
   likeness_score: Optional[float]
@@ -236,6 +257,8 @@ class Date(Entity):
 
 @dataclass(frozen=True)
 class DollarAmount(Entity):
+  __slots__ = ('text', 'words', 'units', 'likeness_score')
+
   text: str
   words: Tuple[Word, ...]
   units: Optional[str]
@@ -267,6 +290,8 @@ class DollarAmount(Entity):
 
 @dataclass(frozen=True)
 class TableCell(Entity):
+  __slots__ = ('content',)
+
   content: Tuple[Entity, ...]
 
   def __init__(
@@ -289,6 +314,8 @@ class TableCell(Entity):
 
 @dataclass(frozen=True)
 class TableRow(Entity):
+  __slots__ = ('cells',)
+
   cells: Tuple[TableCell, ...]
 
   def __init__(
@@ -311,6 +338,8 @@ class TableRow(Entity):
 
 @dataclass(frozen=True)
 class Table(Entity):
+  __slots__ = ('rows',)
+
   rows: Tuple[TableRow, ...]
 
   def __init__(
@@ -333,6 +362,8 @@ class Table(Entity):
 
 @dataclass(frozen=True)
 class Number(Entity):
+  __slots__ = ('words', 'value')
+
   words: Tuple[Word, ...]
   value: Optional[float]
 
@@ -362,6 +393,8 @@ class Number(Entity):
 
 @dataclass(frozen=True)
 class Integer(Entity):
+  __slots__ = ('words', 'value')
+
   words: Tuple[Word, ...]
   value: Optional[int]
 
@@ -391,6 +424,8 @@ class Integer(Entity):
 
 @dataclass(frozen=True)
 class Time(Entity):
+  __slots__ = ('words', 'value', 'likeness_score')
+
   words: Tuple[Word, ...]
   value: Optional[int]
   likeness_score: Optional[float]
@@ -423,6 +458,8 @@ class Time(Entity):
 
 @dataclass(frozen=True)
 class PersonName(Entity):
+  __slots__ = ('text', 'name_parts', 'likeness_score')
+
   text: str
   name_parts: Tuple[Text, ...]
   likeness_score: Optional[float]
@@ -451,6 +488,8 @@ class PersonName(Entity):
 
 @dataclass(frozen=True)
 class Address(Entity):
+  __slots__ = ('text', 'lines', 'address_parts', 'likeness_score')
+
   text: str
   lines: Tuple[Text, ...]
   address_parts: Tuple[Tuple[str, str], ...]
@@ -482,6 +521,8 @@ class Address(Entity):
 
 @dataclass(frozen=True)
 class NamedEntity(Entity):
+  __slots__ = ('text', 'words', 'value', 'label')
+
   text: str
   words: Tuple[Word, ...]
   value: Optional[str]
@@ -511,30 +552,32 @@ class NamedEntity(Entity):
     yield from self.words
 
 
+_ENTITY_REGISTRY: Dict[str, Type[Entity]] = {
+  'Address': Address,
+  'Cluster': Cluster,
+  'Date': Date,
+  'DollarAmount': DollarAmount,
+  'Integer': Integer,
+  'NamedEntity': NamedEntity,
+  'Number': Number,
+  'Page': Page,
+  'PersonName': PersonName,
+  'Text': Text,
+  'Table': Table,
+  'TableCell': TableCell,
+  'TableRow': TableRow,
+  'Time': Time,
+  'Word': Word,
+}
+
+
 def entity_resolver(v: Any) -> Type:
   assert isinstance(v, dict)
-  entity_registry = {
-    'Address': Address,
-    'Cluster': Cluster,
-    'Date': Date,
-    'DollarAmount': DollarAmount,
-    'Integer': Integer,
-    'NamedEntity': NamedEntity,
-    'Number': Number,
-    'Page': Page,
-    'PersonName': PersonName,
-    'Text': Text,
-    'Table': Table,
-    'TableCell': TableCell,
-    'TableRow': TableRow,
-    'Time': Time,
-    'Word': Word,
-  }
   assert 'type' in v
   entity_type = v['type']
-  if entity_type not in entity_registry:
+  if entity_type not in _ENTITY_REGISTRY:
     raise TypeError(f'Entity type {entity_type} not supported')
-  return entity_registry[entity_type]
+  return _ENTITY_REGISTRY[entity_type]
 
 
 def load_entity_from_json(blob: Dict) -> Entity:
@@ -546,4 +589,4 @@ def load_entity_from_json(blob: Dict) -> Entity:
 
 
 def dump_to_json(entity: Entity) -> str:
-  return json.dumps(asdict(entity))
+  return json.dumps(to_json_value(entity))
@@ -63,13 +63,12 @@ interword spacing consistency, etc. The MSRAPI does not return overlapping
 phrases.
 """
 
-import functools
 import heapq
 import operator
 import statistics
 
 from dataclasses import replace
-from itertools import chain, filterfalse
+from itertools import chain
 from typing import Any, Callable, Dict, Generator, Iterable, List, Optional, Sequence, Tuple
 
 from ..document import DocRegion, Document, EZDocRegion
@@ -112,13 +111,17 @@ def sort_word_cluster(cluster: List[Text],
     C = valid_eps * bbox.height
     return Interval(bbox.iy.a - C, bbox.iy.b + C)
 
+  center_ys = [bbox.iy.center for bbox in bboxes]
+
   while left_to_right_ixs:
     tl = topmost(left_to_right_ixs)
     region = valid_region(tl)
-    validity_predicate = lambda i: bboxes[i].center.y in region
-    cur_line = filter(validity_predicate, left_to_right_ixs)
-    left_to_right_ixs = list(
-        filterfalse(validity_predicate, left_to_right_ixs))
+    # Split the remaining boxes into this line and the rest in one pass.
+    cur_line: List[int] = []
+    rest: List[int] = []
+    for i in left_to_right_ixs:
+      (cur_line if center_ys[i] in region else rest).append(i)
+    left_to_right_ixs = rest
 
     yield (cluster[i] for i in cur_line)
 
@@ -161,26 +164,51 @@ def _build_clusters(
     max_tup_length_in_cluster: Upper-bound the size of the generated clusters.
   """
 
+  # The spatial index looks up a cluster's region on every insertion and on
+  # every query it straddles, so compute each region once. Clusters grow one
+  # entity at a time, so a cluster's bbox extends the bbox of its prefix. Like
+  # the score memo below, this is keyed on the ids of the member entities.
+  doc_regions: Dict[Tuple[int, ...], DocRegion] = {}
+
   def doc_region(tup: Tuple[Text, ...]) -> DocRegion:
-    bbox = BBox.spanning(
-      chain.from_iterable(
-        E.bbox.corners() for E in tup))
-    assert bbox
-    return DocRegion(document, bbox)
+    key = tuple(map(id, tup))
+    try:
+      return doc_regions[key]
+    except KeyError:
+      pass
+    if len(tup) == 1:
+      bbox = tup[0].bbox
+    else:
+      prefix, last = doc_region(tup[:-1]).bbox, tup[-1].bbox
+      bbox = BBox(
+        Interval(min(prefix.ix.a, last.ix.a), max(prefix.ix.b, last.ix.b)),
+        Interval(min(prefix.iy.a, last.iy.a), max(prefix.iy.b, last.iy.b)))
+    result = doc_regions[key] = DocRegion(document, bbox)
+    return result
 
   ez_doc_region: EZDocRegion[Tuple[Text, ...]] = EZDocRegion(doc_region)
 
-  for E in Es:
+  # Scores of candidate clusters. Every accepted cluster is scored while testing
+  # whether it can be formed, so the maximality pass below doesn't have to score
+  # it again. Text hashes by value (every word and bbox), so the memo is keyed on
+  # the ids of the member entities instead; Es keeps them alive throughout.
+  scores: Dict[Tuple[int, ...], float] = {}
 
-    @functools.lru_cache(maxsize=None)
-    def can_append_to(tup: Tuple[Text]) -> bool:
-      if len(tup) + 1 > max_tup_length_in_cluster:
-        return False
-      return score_computer(build_text(tup + (E,), None, None)) > 0
+  def score(tup: Tuple[Text, ...]) -> float:
+    key = tuple(map(id, tup))
+    try:
+      return scores[key]
+    except KeyError:
+      result = scores[key] = score_computer(build_text(tup, None, None))
+      return result
 
+  for E in Es:
     new_tups: List[Tuple[Text, ...]] = [(E,)]
     for tup in ez_doc_region.ts_intersecting(bounder(E)):
-      if all(map(can_append_to, _suffixes(tup))):
+      # Suffixes are checked longest-first and share the score memo above, so
+      # a suffix seen while extending another cluster isn't scored twice.
+      if len(tup) < max_tup_length_in_cluster and \
+          all(score(suffix + (E,)) > 0 for suffix in _suffixes(tup)):
         new_tups.append(tup + (E,))
 
     for tup in new_tups:
@@ -190,9 +218,7 @@ def _build_clusters(
   tups = tuple(sorted(ez_doc_region.ts(), key=len))
   result: Dict[Tuple[Entity, ...], Entity] = {}
   for tup in tups:
-    cluster = build_text(tup, 1.0, None)
-    score = score_computer(cluster)
-    cluster = replace(cluster, ocr_score=score)
+    cluster = build_text(tup, 1.0, score(tup))
     result[tup] = cluster
     if len(tup) > 1:
       if tup[1:] in result:
@@ -217,7 +243,7 @@ def build_multiline_clusters(
       document,
       BBox(word.bbox.ix, Interval(y - 2 * entity_height(word), y)))
   multiline_clusters = _build_clusters(
-      sorted(maximal_phrases, key=lambda E: E.bbox.iy.a),
+      sorted(maximal_phrases, key=operator.attrgetter('bbox.iy.a')),
       compute_multiline_cluster_score,
       multiline_cluster_bounder, page, document,
       max_num_lines)
@@ -236,7 +262,7 @@ def build_words_and_phrases(
       document,
       BBox(Interval(x - 6 * entity_height(word), x), word.bbox.iy))
   return _build_clusters(
-      sorted(words, key=lambda E: E.bbox.ix.a),
+      sorted(words, key=operator.attrgetter('bbox.ix.a')),
       compute_ocr_score, phrase_bounder, page, document,
       max_num_words_in_phrase)
 
@@ -252,6 +278,21 @@ def _score_consistency(
   return _score_deviation(max(vals) - min(vals), tolerance, taper_dist)
 
 
+def _thresholded_product(
+    scores: Iterable[float], threshold: float = 0.5) -> float:
+  """The product of the given scores if it exceeds the threshold, else 0.
+
+  Every score lies in [0, 1], so the running product never grows; we stop
+  consuming scores as soon as it drops to the threshold.
+  """
+  product = 1.0
+  for score in scores:
+    product *= score
+    if product <= threshold:
+      return 0
+  return product
+
+
 def compute_ocr_score(E: Text) -> float:
   """Compute the phrase score.
 
@@ -273,60 +314,54 @@ def compute_ocr_score(E: Text) -> float:
 
   assert len(words) >= 2
 
-  baseline = entity_baseline(words)
-  def average_char_height(words: Sequence[Entity]) -> float:
-    # FIXME: This does not work correctly for text at an angle.
-    # FIXME: This isn't really right at all.
-    assert(all(isinstance(W, Word) for W in words))
-
-    return sum(len(word.entity_text or '') * entity_height(word) for word in words) \
-            / sum(len(word.entity_text or '') for word in words)
-  ave_char_height = average_char_height(words)
-  word_baselines = [entity_baseline([word]) for word in words]
-  word_heights = [entity_height(word) for word in words]
-  def left_right_horizontal_distance(E1: Entity, E2: Entity) -> float:
-    return E2.bbox.ix.a - E1.bbox.ix.b
-  interword_distances = [
-      left_right_horizontal_distance(words[i], words[i + 1])
-      for i in range(len(words) - 1)
-  ]
-  baseline_deviations = [
-      abs(word_baseline - baseline) for word_baseline in word_baselines
-  ]
-
-  # We use this as a unit.
-  mu = ave_char_height
-
-  min_interword_distance = 0.0 * mu
-  interword_deviations_from_min = [
-      max(0, min_interword_distance - interword_distance)
-      for interword_distance in interword_distances
-  ]
-
-  max_interword_distance = 0.8 * mu
-  interword_deviations_from_max = [
-      max(0, interword_distance - max_interword_distance)
-      for interword_distance in interword_distances
-  ]
-
-  word_height_consistency_score = _score_consistency(
-      word_heights, 0.3 * mu, 0.5 * mu)
-  baseline_deviation_score = _score_deviation(
-      max(baseline_deviations), 0.1 * mu, 0.3 * mu)
-  interword_distance_consistency_score = _score_consistency(
-      interword_distances, 0.3 * mu, 0.8 * mu)
-  interword_deviation_from_min_score = _score_deviation(
-      max(interword_deviations_from_min), 0.0 * mu, 1.0 * mu)
-  interword_deviation_from_max_score = _score_deviation(
-      max(interword_deviations_from_max), 0.0 * mu, 1.0 * mu)
-
-  computed_score = word_height_consistency_score * baseline_deviation_score * \
-          interword_distance_consistency_score * interword_deviation_from_max_score * \
-          interword_deviation_from_min_score
-
-  score = computed_score if computed_score > 0.5 else 0
-
-  return score
+  # Gather the per-word geometry in a single pass over the words; the scores
+  # below only need extrema of these columns.
+  # FIXME: This does not work correctly for text at an angle.
+  # FIXME: The average char height isn't really right at all.
+  lengths: List[int] = []
+  word_heights: List[float] = []
+  word_baselines: List[float] = []
+  interword_distances: List[float] = []
+  prev_x_max: Optional[float] = None
+  for word in words:
+    assert isinstance(word, Word)
+    bbox = word.bbox
+    lengths.append(len(word.entity_text or ''))
+    word_heights.append(bbox.height)
+    word_baselines.append(bbox.iy.b)
+    if prev_x_max is not None:
+      interword_distances.append(bbox.ix.a - prev_x_max)
+    prev_x_max = bbox.ix.b
+
+  total_length = sum(lengths)
+  baseline = sum(
+    length * bl for length, bl in zip(lengths, word_baselines)) / total_length
+
+  # We use this as a unit: the average char height.
+  mu = sum(
+    length * h for length, h in zip(lengths, word_heights)) / total_length
+
+  min_interword_distance = min(interword_distances)
+  max_interword_distance = max(interword_distances)
+
+  def sub_scores() -> Generator[float, None, None]:
+    # Word height consistency.
+    yield _score_deviation(
+        max(word_heights) - min(word_heights), 0.3 * mu, 0.5 * mu)
+    # Baseline deviation.
+    yield _score_deviation(
+        max(abs(bl - baseline) for bl in word_baselines), 0.1 * mu, 0.3 * mu)
+    # Interword distance consistency.
+    yield _score_deviation(
+        max_interword_distance - min_interword_distance, 0.3 * mu, 0.8 * mu)
+    # Interword distances should fall within [0, 0.8 * mu]; only the extreme
+    # distances can deviate the furthest from that range.
+    yield _score_deviation(
+        max(0, max_interword_distance - 0.8 * mu), 0.0 * mu, 1.0 * mu)
+    yield _score_deviation(
+        max(0, 0.0 * mu - min_interword_distance), 0.0 * mu, 1.0 * mu)
+
+  return _thresholded_product(sub_scores())
 
 
 def compute_multiline_cluster_score(E: Text) -> float:
@@ -341,54 +376,53 @@ def compute_multiline_cluster_score(E: Text) -> float:
 
   assert len(Es) >= 2
 
-  line_heights = [entity_height(E) for E in Es]
-  baseline_separations = [
-    baseline_separation(Es[i], Es[i + 1]) for i in range(len(Es) - 1)
-  ]
-  average_x = statistics.mean([E.bbox.ix.a for E in Es])
-  # FIXME: x deviation should be compared to a best-fit line (if we don't just use an ML model).
-  x_deviations = [abs(E.bbox.ix.a - average_x) for E in Es]
-  def average_char_width(E: Word) -> float:
-    # FIXME: This does not work correctly for text at an angle.
-    assert isinstance(E, Word)
-    return E.bbox.width / len(E.text)
-  average_char_widths = [average_char_width(E) for E in Es]
+  # Gather the per-line geometry in a single pass; the scores below only need
+  # extrema of these columns.
+  # FIXME: This does not work correctly for text at an angle.
+  line_heights: List[float] = []
+  x_mins: List[float] = []
+  average_char_widths: List[float] = []
+  baseline_separations: List[float] = []
+  prev_baseline: Optional[float] = None
+  for line in Es:
+    assert isinstance(line, Word)
+    bbox = line.bbox
+    line_heights.append(bbox.height)
+    x_mins.append(bbox.ix.a)
+    average_char_widths.append(bbox.width / len(line.text))
+    # A word's baseline is the bottom of its bbox; see entity_baseline.
+    if prev_baseline is not None:
+      baseline_separations.append(abs(prev_baseline - bbox.iy.b))
+    prev_baseline = bbox.iy.b
+
+  average_x = statistics.mean(x_mins)
 
   # We use this as a unit.
   mu = statistics.mean(line_heights)
 
-  min_baseline_separation = 1.0 * mu
-  baseline_separation_deviations_from_min: List[float] = [
-      max(0, min_baseline_separation - baseline_separation)
-      for baseline_separation in baseline_separations
-  ]
-
-  max_baseline_separation = 1.5 * mu
-  baseline_separation_deviations_from_max = [
-      max(0, baseline_separation - max_baseline_separation)
-      for baseline_separation in baseline_separations
-  ]
-
-  line_height_consistency_score = _score_consistency(
-      line_heights, 0.1 * mu, 0.1 * mu)
-  baseline_separation_consistency_score = _score_consistency(
-      baseline_separations, 0.3 * mu, 0.3 * mu)
-  x_deviation_score = _score_deviation(max(x_deviations), 0.5 * mu, 0.5 * mu)
-  average_char_width_consistency_score = _score_consistency(
-      average_char_widths, 0.4 * mu, 0.5 * mu)
-  baseline_separation_deviation_from_min_score = _score_deviation(
-      max(baseline_separation_deviations_from_min), 0.0 * mu, 0.2 * mu)
-  baseline_separation_deviation_from_max_score = _score_deviation(
-      max(baseline_separation_deviations_from_max), 0.0 * mu, 0.5 * mu)
-
-  computed_score = line_height_consistency_score * baseline_separation_consistency_score * \
-          x_deviation_score * average_char_width_consistency_score * \
-          baseline_separation_deviation_from_max_score * \
-          baseline_separation_deviation_from_min_score
-
-  score = computed_score if computed_score > 0.5 else 0
-
-  return score
+  min_baseline_separation = min(baseline_separations)
+  max_baseline_separation = max(baseline_separations)
+
+  def sub_scores() -> Generator[float, None, None]:
+    # Line height consistency.
+    yield _score_consistency(line_heights, 0.1 * mu, 0.1 * mu)
+    # Baseline separation consistency.
+    yield _score_deviation(
+        max_baseline_separation - min_baseline_separation, 0.3 * mu, 0.3 * mu)
+    # X deviation.
+    # FIXME: x deviation should be compared to a best-fit line (if we don't just use an ML model).
+    yield _score_deviation(
+        max(abs(x - average_x) for x in x_mins), 0.5 * mu, 0.5 * mu)
+    # Average char width consistency.
+    yield _score_consistency(average_char_widths, 0.4 * mu, 0.5 * mu)
+    # Baseline separations should fall within [mu, 1.5 * mu]; only the extreme
+    # separations can deviate the furthest from that range.
+    yield _score_deviation(
+        max(0, max_baseline_separation - 1.5 * mu), 0.0 * mu, 0.5 * mu)
+    yield _score_deviation(
+        max(0, 1.0 * mu - min_baseline_separation), 0.0 * mu, 0.2 * mu)
+
+  return _thresholded_product(sub_scores())
 
 
 def entity_height(E: Entity) -> float:
@@ -1,6 +1,7 @@
-from typing import Tuple
+from typing import Optional, Tuple
 
 from ..entity import Date, Entity, Text
+from ..functional import without_none
 
 from .type_scoring import date_likeness
 
@@ -14,9 +15,10 @@ def get_dates(entities: Tuple[Entity, ...]) -> Tuple[Date, ...]:
   Args:
     entities: Should be Words or Phrases.
   """
-  def make_date(E: Entity) -> Date:
+  def make_date(E: Entity) -> Optional[Date]:
     assert isinstance(E, Text)
     score, _ = date_likeness(E.text)
+    if score < MINIMUM_SCORE:
+      return None
     return Date(E.bbox, E.text, tuple(E.entity_words()), score)
-  return tuple(filter(lambda E: (E.likeness_score or 0) >= MINIMUM_SCORE,
-    map(make_date, entities)))
+  return tuple(without_none(map(make_date, entities)))
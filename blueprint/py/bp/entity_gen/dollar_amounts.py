@@ -1,7 +1,8 @@
-from typing import Iterable, Tuple
+from typing import Iterable, Optional, Tuple
 
 from ..document import Document
 from ..entity import DollarAmount, Entity, Text
+from ..functional import without_none
 
 from .type_scoring import dollar_amount_likeness
 
@@ -9,18 +10,16 @@ from .type_scoring import dollar_amount_likeness
 MINIMUM_SCORE = 0.5
 
 
-def phrase_subsequences(E: Text) -> Iterable[Text]:
-  """Yields subsequence of this phrase.
-  Each subphrase is a new Text entity, except for the subphrase which
-  spans this entity's children, which is the entity itself.
+def phrase_subsequence_texts(E: Text) -> Iterable[str]:
+  """Yields the texts of the subsequences of this phrase.
+
+  These are the texts of the Text entities built from each contiguous run of
+  this entity's words, but no such entities are constructed.
   """
-  words = E.words
-  for i in range(len(words)):
-    for j in range(i + 1, len(words) + 1):
-      if (j - i) == len(words):
-        yield E
-      else:
-        yield Text.from_words(tuple(words[i:j]))
+  word_texts = tuple(word.text for word in E.words)
+  for i in range(len(word_texts)):
+    for j in range(i + 1, len(word_texts) + 1):
+      yield ' '.join(word_texts[i:j])
 
 
 def score_usd(dollar_candidate: Text) -> float:
@@ -38,9 +37,7 @@ def score_usd(dollar_candidate: Text) -> float:
   # that's most dollar-amount-like considered in its own right will have the
   # highest score.
   child_scores = tuple(
-    dollar_amount_likeness(child.text) for child in
-    phrase_subsequences(dollar_candidate)
-  )
+    map(dollar_amount_likeness, phrase_subsequence_texts(dollar_candidate)))
   # This is not the right way to achieve this goal.
   score = max(child_score + (1 - child_score) * score
     for child_score in child_scores)
@@ -52,13 +49,12 @@ def get_dollar_amounts(entities: Tuple[Entity, ...]) \
   """Get dollar-amount-like entities from the given Entities. Entities should be
   of type Text."""
 
-  def get_dollar_score(E: Text) -> float:
-    return score_usd(E)
-  def make_dollar_amount(E: Entity) -> DollarAmount:
+  def make_dollar_amount(E: Entity) -> Optional[DollarAmount]:
     assert isinstance(E, Text)
+    score = score_usd(E)
+    if score < MINIMUM_SCORE:
+      return None
     words = tuple(E.entity_words())
-    return DollarAmount(
-      E.bbox, E.text, words, likeness_score=get_dollar_score(E))
+    return DollarAmount(E.bbox, E.text, words, likeness_score=score)
 
-  return tuple(filter(lambda E: (E.likeness_score or 0) >= MINIMUM_SCORE,
-    map(make_dollar_amount, entities)))
+  return tuple(without_none(map(make_dollar_amount, entities)))
@@ -1,55 +1,56 @@
+import re
+
+from functools import lru_cache
 from typing import Dict, Tuple
 
 from ..string_algos import relative_edit_distance
 
 
+_LONG_MONTHS = (
+    'JANUARY', 'FEBRUARY', 'MARCH', 'APRIL', 'MAY', 'JUNE', 'JULY', 'AUGUST',
+    'SEPTEMBER', 'OCTOBER', 'NOVEMBER', 'DECEMBER'
+)
+_SHORT_MONTHS = (
+    'JAN', 'FEB', 'MAR', 'APR', 'MAY', 'JUN', 'JUL', 'AUG', 'SEP', 'OCT', 'NOV',
+    'DEC'
+)
+# Long months come first in the alternation, so that they win over the short
+# month they start with.
+_MONTH_REGEX = re.compile('|'.join(_LONG_MONTHS + _SHORT_MONTHS))
+_DIGITS_AND_SLASHES = str.maketrans('012345678/', '999999999-')
+_SEPARATORS = str.maketrans('.,', '  ')
+
+_DATE_PATTERNS = (
+    'JAN-99-99',
+    'JAN-99TH-99',
+    '99-JAN-99',
+    '99TH-JAN-99',
+    '99-99-99',
+    '99JAN99',
+)
+
+
 def date_likeness(text: str) -> Tuple[float, Dict]:
   # FIXME: This is all very janky.
 
   if len(text) > 20:
     return (0, {'text_too_long': True})
 
-  text = text.upper()
-
-  long_months = {
-      'JANUARY', 'FEBRUARY', 'MARCH', 'APRIL', 'MAY', 'JUNE', 'JULY', 'AUGUST',
-      'SEPTEMBER', 'OCTOBER', 'NOVEMBER', 'DECEMBER'
-  }
-  short_months = {
-      'JAN', 'FEB', 'MAR', 'APR', 'MAY', 'JUN', 'JUL', 'AUG', 'SEP', 'OCT',
-      'NOV', 'DEC'
-  }
-
-  for long_month in long_months:
-    text = text.replace(long_month, 'JAN')
-  for short_month in short_months:
-    text = text.replace(short_month, 'JAN')
-
-  for digit in '012345678':
-    text = text.replace(digit, '9')
-
-  text = text.replace('/', '-')
+  text = _MONTH_REGEX.sub('JAN', text.upper())
+  text = text.translate(_DIGITS_AND_SLASHES)
   text = text.replace('9.9', '9-9')
-  text = text.replace('.', ' ')
-  text = text.replace(',', ' ')
+  text = text.translate(_SEPARATORS)
   text = '99'.join(text.rsplit('9999', 1))
   text = '-'.join(text.split())
 
-  patterns = [
-      'JAN-99-99',
-      'JAN-99TH-99',
-      '99-JAN-99',
-      '99TH-JAN-99',
-      '99-99-99',
-      '99JAN99',
-  ]
-
   scores = {
-      pattern: 1 - relative_edit_distance(pattern, text) for pattern in patterns
+      pattern: 1 - relative_edit_distance(pattern, text)
+      for pattern in _DATE_PATTERNS
   }
   return (max(scores.values()), scores)
 
 
+@lru_cache(maxsize=4096)
 def dollar_amount_likeness(text: str) -> float:
   if text == '.00':
     return 1  # FIXME: This method needs to be revisited.
@@ -64,10 +65,17 @@ def dollar_amount_likeness(text: str) -> float:
 
   legal_chars = digits + seps + symbols + other_legal
 
-  num_digits = len([c for c in text if c in digits])
-  num_seps = len([c for c in text if c in seps])
-  num_symbols = len([c for c in text if c in symbols])
-  num_other_legal = len([c for c in text if c in other_legal])
+  # Classify each character in a single pass; the classes are disjoint.
+  num_digits = num_seps = num_symbols = num_other_legal = 0
+  for c in text:
+    if c in digits:
+      num_digits += 1
+    elif c in seps:
+      num_seps += 1
+    elif c in symbols:
+      num_symbols += 1
+    elif c in other_legal:
+      num_other_legal += 1
 
   num_legal_chars = num_digits + num_seps + num_symbols + num_other_legal
 
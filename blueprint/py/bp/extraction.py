@@ -6,12 +6,12 @@ Typically an extraction is represented as a tuple of field-entity pairs.
 import json
 
 from dataclasses import asdict, dataclass, replace
-from functools import lru_cache
 from itertools import chain
 from pathlib import Path
-from typing import Any, Collection, Dict, FrozenSet, Generator, Iterable, Optional, Set, Tuple, TypeVar
+from typing import Any, Collection, Dict, FrozenSet, Generator, Optional, Tuple
 
 from .entity import Entity, entity_resolver
+from .frozen_slots import FrozenSlots
 from .geometry import BBox
 from .instantiate import instantiate
 
@@ -30,9 +30,6 @@ Field = str
 Assignment = Optional[Entity]
 
 
-T = TypeVar('T')
-
-
 class MissingFieldsError(KeyError):
   """A function or operation was passed a collection of fields that was missing
   required fields."""
@@ -71,7 +68,7 @@ class ExtractionPoint:
 
 
 @dataclass(frozen=True)
-class Extraction:
+class Extraction(FrozenSlots):
   """An assignment from some fields to some entities in some document.
 
   When we say we "want to extract the net and gross pay", another way of framing
@@ -87,13 +84,21 @@ class Extraction:
   extractions. Blueprint's library of rules enable you to describe good
   extractions look and behave, by listing rules that the fields should follow.
   """
+  # _dictionary and _fields are not fields; they cache build_dictionary() and
+  # the fields property once computed.
+  __slots__ = ('assignments', '_dictionary', '_fields')
 
   assignments: Tuple[ExtractionPoint, ...]
 
   @property
   def fields(self) -> FrozenSet[Field]:
     """The fields for which this extraction has entity assignments."""
-    return frozenset(self.build_dictionary().keys())
+    try:
+      return self._fields # type: ignore
+    except AttributeError:
+      fields = frozenset(self.build_dictionary().keys())
+      object.__setattr__(self, '_fields', fields)
+      return fields
 
   @property
   def entities(self) -> FrozenSet[Entity]:
@@ -104,9 +109,13 @@ class Extraction:
   def is_empty(self) -> bool:
     return self.assignments == tuple()
 
-  @lru_cache(maxsize=None)
   def build_dictionary(self) -> Dict[Field, Entity]:
-    return {point.field: point.entity for point in self.assignments}
+    try:
+      return self._dictionary # type: ignore
+    except AttributeError:
+      dictionary = {point.field: point.entity for point in self.assignments}
+      object.__setattr__(self, '_dictionary', dictionary)
+      return dictionary
 
   def __bool__(self) -> bool:
     return not self.is_empty
@@ -128,7 +137,7 @@ class Extraction:
             frozenset(self.assignments) == frozenset(other.assignments)
 
   def __contains__(self, field: Field) -> bool:
-    return field in self.fields
+    return field in self.build_dictionary()
 
   def __len__(self) -> int:
     return len(self.assignments)
@@ -161,15 +170,9 @@ class Extraction:
     Args:
       extractions: Input extractions. These must not have any fields in common.
     """
-    def pairwise_disjoint(tss: Iterable[Iterable[T]]) -> bool:
-      s: Set[T] = set()
-      for t in chain.from_iterable(tss):
-        if t in s:
-          return False
-        s.add(t)
-      return True
-
-    if not pairwise_disjoint(extraction.fields for extraction in extractions):
+    field_sets = [extraction.fields for extraction in extractions]
+    # The field sets are pairwise disjoint iff no field is lost in their union.
+    if sum(map(len, field_sets)) != len(frozenset().union(*field_sets)):
       raise OverlappingFieldsError(f'cannot merge extractions {extractions}')
 
     return Extraction(tuple(chain.from_iterable(extraction.assignments
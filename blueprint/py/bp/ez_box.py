@@ -1,6 +1,4 @@
-import itertools
-
-from typing import Callable, Generator, Generic, Optional, Set, Tuple, TypeVar
+from typing import Callable, Dict, Generator, Generic, List, Tuple, TypeVar
 
 from .geometry import BBox, Interval
 
@@ -17,7 +15,9 @@ class EZBox(Generic[T]):
     self.bbox = bbox
     self.bbox_getter = bbox_getter
     self.ideal_width_to_height_ratio = ideal_width_to_height_ratio
-    self.straddlers: Set[T] = set()
+    # Each item is stored with its bbox, so the getter is called once per
+    # item rather than on every descent, split and query.
+    self.straddlers: Dict[T, BBox] = {}
     self.child_nodes: Tuple['EZBox[T]', ...] = tuple()
 
   def __str__(self) -> str:
@@ -26,7 +26,10 @@ class EZBox(Generic[T]):
         self.child_nodes)
 
   def insert(self, t: T) -> None:
-    bbox = self.bbox_getter(t)
+    self.insert_with_bbox(t, self.bbox_getter(t))
+
+  def insert_with_bbox(self, t: T, bbox: BBox) -> None:
+    """Inserts t, whose bbox (as returned by bbox_getter) is already known."""
     if not self.bbox.contains_bbox(bbox):
       raise ValueError(
           f'attempted to insert out-of-bounds item {t} into {self}')
@@ -34,49 +37,67 @@ class EZBox(Generic[T]):
     if self.child_nodes:
       for child in self.child_nodes:
         if child.bbox.contains_bbox(bbox):
-          child.insert(t)
+          child.insert_with_bbox(t, bbox)
           return
-      self.straddlers.add(t)
+      self.straddlers[t] = bbox
       return
 
-    self.straddlers.add(t)
+    self.straddlers[t] = bbox
     if len(self.straddlers) > 5:  # FIXME: Magic number.
       self._split()
 
-  def ts(self) -> Generator[T, None, None]:
-    yield from self.straddlers
-    yield from itertools.chain.from_iterable(
-        child.ts() for child in self.child_nodes)
-
-  def ts_contained_in(self, bbox_: BBox) -> Generator[T, None, None]:
-    bbox = BBox.intersection([bbox_, self.bbox])
-    if not bbox:
-      return
-
-    for straddler in self.straddlers:
-      if bbox.contains_bbox(self.bbox_getter(straddler)):
-        yield straddler
+  # The queries below walk the tree with an explicit stack rather than
+  # recursing through nested generators. Children are pushed in reverse so
+  # that items are yielded in the same (preorder) sequence as a recursive walk.
 
-    for child in self.child_nodes:
-      yield from child.ts_contained_in(bbox)
-
-  def ts_intersecting(self, bbox_: BBox) -> Generator[T, None, None]:
-    bbox = BBox.intersection([bbox_, self.bbox])
-    if not bbox:
-      return
-
-    for straddler in self.straddlers:
-      if bbox.intersects_bbox(self.bbox_getter(straddler)):
-        yield straddler
-
-    for child in self.child_nodes:
-      yield from child.ts_intersecting(bbox)
+  def ts(self) -> Generator[T, None, None]:
+    stack = [self]
+    while stack:
+      node = stack.pop()
+      yield from node.straddlers
+      stack.extend(reversed(node.child_nodes))
+
+  def ts_contained_in(self, bbox: BBox) -> Generator[T, None, None]:
+    return self._search(bbox, True)
+
+  def ts_intersecting(self, bbox: BBox) -> Generator[T, None, None]:
+    return self._search(bbox, False)
+
+  def _search(
+      self, bbox: BBox, contained: bool) -> Generator[T, None, None]:
+    # Each entry is a node together with the query clipped to its parent.
+    stack: List[Tuple['EZBox[T]', float, float, float, float]] = [
+      (self, bbox.ix.a, bbox.ix.b, bbox.iy.a, bbox.iy.b)]
+    while stack:
+      node, qx0, qx1, qy0, qy1 = stack.pop()
+      nix, niy = node.bbox.ix, node.bbox.iy
+
+      # Everything in this node lies within node.bbox.
+      if qx0 <= nix.a <= nix.b <= qx1 and qy0 <= niy.a <= niy.b <= qy1:
+        yield from node.ts()
+        continue
+
+      x0, x1 = max(qx0, nix.a), min(qx1, nix.b)
+      y0, y1 = max(qy0, niy.a), min(qy1, niy.b)
+      if x0 > x1 or y0 > y1:
+        continue
+
+      for straddler, straddler_bbox in node.straddlers.items():
+        six, siy = straddler_bbox.ix, straddler_bbox.iy
+        if contained:
+          if x0 <= six.a <= six.b <= x1 and y0 <= siy.a <= siy.b <= y1:
+            yield straddler
+        elif not (x1 < six.a or six.b < x0 or y1 < siy.a or siy.b < y0):
+          yield straddler
+
+      stack.extend(
+        (child, x0, x1, y0, y1) for child in reversed(node.child_nodes))
 
   def _split(self) -> None:
     assert not self.child_nodes
 
     ts = self.straddlers
-    self.straddlers = set()
+    self.straddlers = {}
 
     VERTICAL_SPLIT = 1
     HORIZONTAL_SPLIT = 2
@@ -110,5 +131,5 @@ class EZBox(Generic[T]):
           self.ideal_width_to_height_ratio)
       self.child_nodes = (upper, lower)
 
-    for t in ts:
-      self.insert(t)
+    for t, bbox in ts.items():
+      self.insert_with_bbox(t, bbox)
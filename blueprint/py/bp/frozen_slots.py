@@ -0,0 +1,22 @@
+"""Pickling support for frozen dataclasses that declare __slots__."""
+
+from dataclasses import fields
+from typing import Any, Dict
+
+
+class FrozenSlots:
+  """A base for frozen dataclasses with hand-written __slots__.
+
+  Without a __dict__, pickle and copy restore slot state with setattr, which a
+  frozen dataclass rejects. This saves only the dataclass fields and restores
+  them directly; any other slots are caches, which are recomputed on demand.
+  """
+
+  __slots__ = ()
+
+  def __getstate__(self) -> Dict[str, Any]:
+    return {f.name: getattr(self, f.name) for f in fields(self)} # type: ignore
+
+  def __setstate__(self, state: Dict[str, Any]) -> None:
+    for name, value in state.items():
+      object.__setattr__(self, name, value)
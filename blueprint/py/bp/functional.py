@@ -1,3 +1,4 @@
+from collections import Counter
 from itertools import chain, tee
 from typing import Callable, Collection, Dict, FrozenSet, Generator, Iterable, Optional, Set, Tuple, TypeVar
 
@@ -6,22 +7,19 @@ T = TypeVar('T')
 
 
 def arg_max(f: Callable[[T], float], ts: Iterable[T]) -> T:
-  ts = tuple(ts)
-  if not ts:
-    raise ValueError('empty input')
-  best = None
-  for t in ts:
-    candidate = (t, f(t))
-    if best is None or candidate[1] > best[1]:
-      best = candidate
-  assert best
-  return best[0]
+  """The first t in ts maximizing f."""
+  ts = iter(ts)
+  for first_t in ts:
+    return max(chain((first_t,), ts), key=f)
+  raise ValueError('empty input')
 
 
 def arg_min(f: Callable[[T], float], ts: Iterable[T]) -> T:
-  if not ts:
-    raise ValueError('empty input')
-  return arg_max(lambda t: -f(t), ts)
+  """The first t in ts minimizing f."""
+  ts = iter(ts)
+  for first_t in ts:
+    return min(chain((first_t,), ts), key=f)
+  raise ValueError('empty input')
 
 
 def comma_sep(ts: Iterable[T]) -> str:
@@ -73,29 +71,19 @@ def all_distinct(ts: Collection[T]) -> bool:
 
 def multiplicities(ts: Collection[T]) -> Dict[T, int]:
   """How often does each t appear in ts?"""
-  result: Dict[T, int] = {}
-  for t in ts:
-    if t not in result:
-      result[t] = 0
-    result[t] += 1
-  return result
+  return dict(Counter(ts))
 
 
 def repeated_elements(ts: Collection[T]) -> FrozenSet[T]:
   """Which of the ts appear in the input collection more than once?"""
-  m = multiplicities(ts)
-  return frozenset({t for t in ts if m[t] > 1})
+  return frozenset(t for t, count in Counter(ts).items() if count > 1)
 
 
 def all_equal(ts: Iterable[T]) -> bool:
-  try:
-    ts = iter(ts)
-    first_t = next(ts)
-    while True:
-      if first_t != next(ts):
-        return False
-  except StopIteration:
-    return True
+  ts = iter(ts)
+  for first_t in ts:
+    return not any(first_t != t for t in ts)
+  return True
 
 
 def empty(ts: Collection[T]) -> bool:
@@ -71,6 +71,15 @@ class Interval:
   def build(a: float, b: float) -> Optional['Interval']:
     return Interval(a, b) if a <= b else None
 
+  @staticmethod
+  def of_pair(a: float, b: float) -> 'Interval':
+    """The interval spanning a and b, in either order.
+
+    This is Interval.spanning([a, b]) without the tuple and min/max calls;
+    OCR loaders build two of these per word.
+    """
+    return Interval(a, b) if a <= b else Interval(b, a)
+
   @staticmethod
   def spanning(xs: Iterable[float]) -> 'Interval':
     xs = tuple(xs)
@@ -172,13 +181,17 @@ class BBox:
     yield Point(self.ix.b, self.iy.b)
     yield Point(self.ix.b, self.iy.a)
 
+  # These two are on the hot path of every spatial query, so the interval
+  # comparisons are inlined rather than delegated to Interval.
+
   def contains_bbox(self, other: 'BBox') -> bool:
-    return self.ix.contains_interval(other.ix) and self.iy.contains_interval(
-        other.iy)
+    ix, iy, oix, oiy = self.ix, self.iy, other.ix, other.iy
+    return ix.a <= oix.a <= oix.b <= ix.b and iy.a <= oiy.a <= oiy.b <= iy.b
 
   def intersects_bbox(self, other: 'BBox') -> bool:
-    return self.ix.intersects_interval(
-        other.ix) and self.iy.intersects_interval(other.iy)
+    ix, iy, oix, oiy = self.ix, self.iy, other.ix, other.iy
+    return not (ix.b < oix.a or oix.b < ix.a) \
+      and not (iy.b < oiy.a or oiy.b < iy.a)
 
   def percentages_overlapping(self, other: 'BBox') -> Optional['BBox']:
     """The percentage ranges of self which other overlaps.
@@ -207,14 +220,23 @@ class BBox:
 
   @staticmethod
   def intersection(bs: Iterable['BBox']) -> Optional['BBox']:
-    bs = tuple(bs)
-    if not bs:
+    # A single pass over the coordinates; once the running intersection is
+    # empty it stays empty.
+    bs = iter(bs)
+    first = next(bs, None)
+    if first is None:
       return None
-    ix = Interval.intersection(b.ix for b in bs)
-    iy = Interval.intersection(b.iy for b in bs)
-    if ix is None or iy is None:
+    x0, x1, y0, y1 = first.ix.a, first.ix.b, first.iy.a, first.iy.b
+    for b in bs:
+      x0 = max(x0, b.ix.a)
+      x1 = min(x1, b.ix.b)
+      y0 = max(y0, b.iy.a)
+      y1 = min(y1, b.iy.b)
+      if x0 > x1 or y0 > y1:
+        return None
+    if x0 > x1 or y0 > y1:
       return None
-    return BBox(ix, iy)
+    return BBox(Interval(x0, x1), Interval(y0, y1))
 
   @staticmethod
   def union(bs: Iterable['BBox']) -> Optional['BBox']:
@@ -223,9 +245,23 @@ class BBox:
     Returns:
       None if bs is an empty iterator.
     """
-    b = BBox.spanning(
-      chain.from_iterable([b.corners() for b in bs]))
-    return b
+    # A single pass over the intervals, without building corner Points.
+    bs = iter(bs)
+    first = next(bs, None)
+    if first is None:
+      return None
+    x0, x1, y0, y1 = first.ix.a, first.ix.b, first.iy.a, first.iy.b
+    for b in bs:
+      ix, iy = b.ix, b.iy
+      if ix.a < x0:
+        x0 = ix.a
+      if ix.b > x1:
+        x1 = ix.b
+      if iy.a < y0:
+        y0 = iy.a
+      if iy.b > y1:
+        y1 = iy.b
+    return BBox(Interval(x0, x1), Interval(y0, y1))
 
   @staticmethod
   def distance(b1: 'BBox', b2: 'BBox') -> float:
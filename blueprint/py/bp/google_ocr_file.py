@@ -3,7 +3,7 @@
 import json
 import logging
 
-from itertools import chain
+from itertools import accumulate, chain
 from pathlib import Path
 from typing import Any, Dict, Generator, Iterable, List, Optional, Tuple
 
@@ -20,8 +20,7 @@ def _bbox(vertices: List[Dict]) -> BBox:
   x1: float = vertices[1]['x']
   y0: float = vertices[0]['y']
   y1: float = vertices[2]['y']
-  return BBox(Interval.spanning([x0, x1]),
-              Interval.spanning([y0, y1]))
+  return BBox(Interval.of_pair(x0, x1), Interval.of_pair(y0, y1))
 
 
 def _get_input_word_from_google_word(word: Dict) -> InputWord:
@@ -43,10 +42,11 @@ def _get_words_from_page(page: Dict) -> Tuple[InputWord, ...]:
 
 def generate_doc_from_google_ocr_json(raw_json: Dict, name: str) -> Document:
   document_pages = raw_json['fullTextAnnotation']['pages']
+  y_offsets = (0, *accumulate(page['height'] for page in document_pages))
 
   def prepare_input_page(page_number: int, page: Dict) -> InputPage:
     input_words = _get_words_from_page(page)
-    y_offset = sum(document_pages[i]['height'] for i in range(page_number))
+    y_offset = y_offsets[page_number]
     bp_page = Page(
       BBox(
         Interval(0, page['width']),
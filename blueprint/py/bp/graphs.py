@@ -1,6 +1,6 @@
 from dataclasses import dataclass, field
 from itertools import chain
-from typing import Collection, Dict, FrozenSet, Generic, Iterable, Tuple, TypeVar
+from typing import Any, Collection, Dict, FrozenSet, Generic, Iterable, List, Tuple, TypeVar
 
 from .extraction import Field
 from .functional import empty
@@ -11,26 +11,52 @@ Component = FrozenSet[T]
 Edge = Tuple[T, T]
 
 
+class _EdgeIndex:
+  """Edges grouped by the vertices they touch."""
+
+  __slots__ = ('incident', 'incoming', 'outgoing')
+
+  def __init__(self, edges: Iterable[Edge]):
+    self.incident: Dict[Any, List[Edge]] = {}
+    self.incoming: Dict[Any, List[Edge]] = {}
+    self.outgoing: Dict[Any, List[Edge]] = {}
+    for edge in edges:
+      assert len(edge) == 2
+      source, target = edge
+      self.outgoing.setdefault(source, []).append(edge)
+      self.incoming.setdefault(target, []).append(edge)
+      self.incident.setdefault(source, []).append(edge)
+      if target != source:
+        self.incident.setdefault(target, []).append(edge)
+
+
 @dataclass(frozen=True)
 class Graph(Generic[T]):
 
   vertices: FrozenSet[T] = frozenset()
   edges: FrozenSet[Edge] = frozenset()
 
+  def _edge_index(self) -> '_EdgeIndex':
+    """The edges incident to, into and out of each vertex.
+
+    Built on first use with a single pass over the edges, and cached on the
+    (frozen) graph.
+    """
+    try:
+      return self.__dict__['_edge_index_cache']
+    except KeyError:
+      index = _EdgeIndex(self.edges)
+      object.__setattr__(self, '_edge_index_cache', index)
+      return index
+
   def degree(self, vertex: T) -> int:
-    return len(tuple(filter(lambda p: vertex in p, self.edges)))
+    return len(self._edge_index().incident.get(vertex, ()))
 
   def indegree(self, vertex: T) -> int:
-    def _filter(edge: Edge) -> bool:
-      assert len(edge) == 2
-      return vertex == edge[1]
-    return len(tuple(filter(_filter, self.edges)))
+    return len(self._edge_index().incoming.get(vertex, ()))
 
   def outdegree(self, vertex: T) -> int:
-    def _filter(edge: Edge) -> bool:
-      assert len(edge) == 2
-      return vertex == edge[0]
-    return len(tuple(filter(_filter, self.edges)))
+    return len(self._edge_index().outgoing.get(vertex, ()))
 
   @property
   def maximum_vertex_degree(self) -> int:
@@ -39,14 +65,14 @@ class Graph(Generic[T]):
     return max(self.degree(v) for v in self.vertices)
 
   def neighbors(self, vertex: T) -> FrozenSet[T]:
-    edges = tuple(filter(lambda p: vertex in p, self.edges))
+    edges = self._edge_index().incident.get(vertex, ())
     return frozenset(chain.from_iterable(edges)) - frozenset((vertex,))
 
   def restricted_to(self, fields: FrozenSet[Field]) -> 'Graph':
     return Graph(
       vertices=fields,
-      edges=frozenset(filter(
-        lambda p: fields.issuperset(frozenset(p)), self.edges)))
+      edges=frozenset(
+        p for p in self.edges if p[0] in fields and p[1] in fields))
 
   def with_vertices_collapsed(self,
                               old_vertices: Collection[T],
@@ -63,21 +89,53 @@ class Graph(Generic[T]):
       new_vertex: A vertex to add to the graph.
     """
     old_vertices = frozenset(old_vertices)
-    def new_edge(old_edge: Edge) -> Edge:
-      def new_edge_vertex(vertex: T) -> T:
-        return new_vertex if vertex in old_vertices else vertex
-      return (new_edge_vertex(old_edge[0]),
-              new_edge_vertex(old_edge[1]))
+    new_edges = frozenset(
+      (new_vertex if a in old_vertices else a,
+       new_vertex if b in old_vertices else b)
+      for a, b in self.edges)
     return Graph(self.vertices - old_vertices | frozenset({new_vertex}),
-                 frozenset(map(new_edge, self.edges)))
+                 new_edges)
 
   def with_vertices_removed(self, vertices: Collection[T]) -> 'Graph':
     vertices = frozenset(vertices)
-    remaining_edges = frozenset(filter(
-      lambda E: all(V not in E for V in vertices), self.edges))
+    remaining_edges = frozenset(
+      E for E in self.edges if E[0] not in vertices and E[1] not in vertices)
     return Graph(self.vertices - vertices, remaining_edges)
 
 
+class _DisjointSets:
+  """A union-find forest, with path compression and union by rank."""
+
+  __slots__ = ('parent', 'rank')
+
+  def __init__(self) -> None:
+    self.parent: Dict[Any, Any] = {}
+    self.rank: Dict[Any, int] = {}
+
+  def add(self, t: Any) -> None:
+    if t not in self.parent:
+      self.parent[t] = t
+      self.rank[t] = 0
+
+  def find(self, t: Any) -> Any:
+    root = t
+    while self.parent[root] != root:
+      root = self.parent[root]
+    while t != root:
+      self.parent[t], t = root, self.parent[t]
+    return root
+
+  def union(self, t1: Any, t2: Any) -> None:
+    root1, root2 = self.find(t1), self.find(t2)
+    if root1 == root2:
+      return
+    if self.rank[root1] < self.rank[root2]:
+      root1, root2 = root2, root1
+    self.parent[root2] = root1
+    if self.rank[root1] == self.rank[root2]:
+      self.rank[root1] += 1
+
+
 def components(
     complete_graphs: Iterable[Iterable[T]]) -> FrozenSet[Component[T]]:
   """Given a set of complete graphs, return the connected components of their
@@ -88,18 +146,20 @@ def components(
       a complete graph.
   """
 
-  components: Dict[T, Component] = {}
+  disjoint_sets = _DisjointSets()
 
   for K in complete_graphs:
-    ts = frozenset(K)
-    existing_components = frozenset(
-        components[t] for t in ts if t in components)
-    new_component = ts.union(*existing_components)
-
-    for t in new_component:
-      components[t] = new_component
-
-  return frozenset(components.values())
+    ts = iter(K)
+    for first_t in ts:
+      disjoint_sets.add(first_t)
+      for t in ts:
+        disjoint_sets.add(t)
+        disjoint_sets.union(first_t, t)
+
+  components: Dict[Any, List[T]] = {}
+  for t in disjoint_sets.parent:
+    components.setdefault(disjoint_sets.find(t), []).append(t)
+  return frozenset(frozenset(ts) for ts in components.values())
 
 @dataclass(frozen=True)
 class WeightedMultiGraph(Graph[T]):
@@ -118,47 +178,43 @@ class WeightedMultiGraph(Graph[T]):
     assert(frozenset(self.weights.keys()) == frozenset(self.edges))
 
   def degree(self, vertex: T) -> int:
-    return sum(tuple(len(self.weights[p]) for p in self.edges if vertex in p))
+    return sum(len(self.weights[p])
+      for p in self._edge_index().incident.get(vertex, ()))
 
   def indegree(self, vertex: T) -> int:
-    def _filter(edge: Edge) -> bool:
-      assert len(edge) == 2
-      return vertex == edge[1]
-    return sum(tuple(len(self.weights[p]) for p in filter(_filter, self.edges)))
+    return sum(len(self.weights[p])
+      for p in self._edge_index().incoming.get(vertex, ()))
 
   def outdegree(self, vertex: T) -> int:
-    def _filter(edge: Edge) -> bool:
-      assert len(edge) == 2
-      return vertex == edge[0]
-    return sum(tuple(len(self.weights[p]) for p in filter(_filter, self.edges)))
+    return sum(len(self.weights[p])
+      for p in self._edge_index().outgoing.get(vertex, ()))
 
   def restricted_to(self, fields: FrozenSet[Field]) -> 'WeightedMultiGraph':
-    remaining_edges = frozenset(filter(
-        lambda p: fields.issuperset(frozenset(p)), self.edges))
+    remaining_edges = frozenset(
+      p for p in self.edges if p[0] in fields and p[1] in fields)
     return WeightedMultiGraph(
       vertices = fields,
       edges = remaining_edges,
-      weights = dict(filter(
-        lambda e: e[0] in remaining_edges, self.weights.items())))
+      weights = {
+        edge: edgeweights for edge, edgeweights in self.weights.items()
+        if edge in remaining_edges})
 
   def with_vertices_collapsed(self,
                               old_vertices: Collection[T],
                               new_vertex: T
   ) -> 'WeightedMultiGraph':
     old_vertices = frozenset(old_vertices)
-    def new_edge(old_edge: Edge) -> Edge:
-      def new_edge_vertex(vertex: T) -> T:
-        return new_vertex if vertex in old_vertices else vertex
-      return (new_edge_vertex(old_edge[0]),
-              new_edge_vertex(old_edge[1]))
     new_weights: Dict[Edge,Tuple[float,...]] = {}
-    for edge, edgeweights in self.weights.items():
-      new_weights[new_edge(edge)] = edgeweights + new_weights[new_edge(edge)] \
-        if new_edge(edge) in new_weights else edgeweights
+    for (a, b), edgeweights in self.weights.items():
+      new_edge = (new_vertex if a in old_vertices else a,
+                  new_vertex if b in old_vertices else b)
+      new_weights[new_edge] = edgeweights + new_weights.get(new_edge, ())
 
+    # weights has exactly one key per edge, so its collapsed keys are the
+    # collapsed edges.
     return WeightedMultiGraph(
       self.vertices - old_vertices | frozenset({new_vertex}),
-      frozenset(map(new_edge, self.edges)),
+      frozenset(new_weights),
       new_weights)
 
   def with_vertices_removed(
@@ -166,10 +222,11 @@ class WeightedMultiGraph(Graph[T]):
     vertices: Collection[T]
   ) -> 'WeightedMultiGraph':
     vertices = frozenset(vertices)
-    remaining_edges = frozenset(filter(
-      lambda E: all(V not in E for V in vertices), self.edges))
-    remaining_weights = dict(filter(
-      lambda e: e[0] in remaining_edges, self.weights.items()))
+    remaining_edges = frozenset(
+      E for E in self.edges if E[0] not in vertices and E[1] not in vertices)
+    remaining_weights = {
+      edge: edgeweights for edge, edgeweights in self.weights.items()
+      if edge in remaining_edges}
     return WeightedMultiGraph(self.vertices - vertices,
       remaining_edges,
       remaining_weights)
@@ -4,7 +4,7 @@ from hocr_parser.bbox import BBox as hocr_BBox
 from hocr_parser.hocr_document import HOCRDocument
 from hocr_parser.hocr_node import HOCRNode
 
-from itertools import chain
+from itertools import accumulate, chain
 from pathlib import Path
 from typing import Tuple, Optional
 
@@ -16,8 +16,8 @@ from .ocr import WordConfidence
 
 
 def _bbox(vertices: hocr_BBox) -> BBox:
-  return BBox(Interval.spanning([vertices.x1, vertices.x2]),
-              Interval.spanning([vertices.y1, vertices.y2]))
+  return BBox(Interval.of_pair(vertices.x1, vertices.x2),
+              Interval.of_pair(vertices.y1, vertices.y2))
 
 def _get_input_word_from_hocr_word(word: HOCRNode) -> InputWord:
   if word.bbox is None:
@@ -35,26 +35,28 @@ def _get_words_from_page(page: HOCRNode) -> Tuple[InputWord, ...]:
     for paragraph in page.paragraphs))
 
 
+def _page_bbox(page: HOCRNode) -> hocr_BBox:
+  if page.bbox is None:
+    raise ValueError(f"Node {page} doesn't have a bounding box")
+  return page.bbox
+
+
 def generate_doc_from_hocr(root: Optional[HOCRNode], name: str) -> Document:
   if root is None:
     raise ValueError(f"No root")
   document_pages = root.pages
+  page_bboxes = tuple(map(_page_bbox, document_pages))
+  y_offsets = (0, *accumulate(bbox.y2 - bbox.y1 for bbox in page_bboxes))
 
   def prepare_input_page(page_number: int, page: HOCRNode) -> InputPage:
-    if page.bbox is None:
-      raise ValueError(f"Node {page} doesn't have a bounding box")
-
     input_words = _get_words_from_page(page)
-    y_offset = 0
-    for i in range(page_number):
-      if document_pages[i].bbox is None:
-        raise ValueError(f"Node {document_pages[i]} doesn't have a bounding box")
-      y_offset += document_pages[i].bbox.y2 - document_pages[i].bbox.y1 # type: ignore
+    bbox = page_bboxes[page_number]
+    y_offset = y_offsets[page_number]
 
     bp_page = Page(
       BBox(
-        Interval(0, page.bbox.x2 - page.bbox.x1),
-        Interval(y_offset, page.bbox.y2 - page.bbox.y1 + y_offset)),
+        Interval(0, bbox.x2 - bbox.x1),
+        Interval(y_offset, bbox.y2 - bbox.y1 + y_offset)),
       page_number + 1)
     return InputPage(bp_page, input_words)
 
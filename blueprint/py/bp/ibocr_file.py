@@ -4,8 +4,9 @@ import itertools
 import json
 import logging
 
+from collections import defaultdict
 from pathlib import Path
-from typing import Any, Dict, Generator, Iterable, Optional, Tuple
+from typing import Any, DefaultDict, Dict, Generator, Iterable, List, Optional, Tuple
 
 from .build_document import InputPage, InputWord, build_document
 from .document import Document
@@ -18,8 +19,7 @@ def _bbox(w: Dict) -> BBox:
   x1: float = w['end_x']
   y0: float = w['start_y']
   y1: float = w['end_y']
-  return BBox(Interval.spanning([x0, x1]),
-              Interval.spanning([y0, y1]))
+  return BBox(Interval.of_pair(x0, x1), Interval.of_pair(y0, y1))
 
 
 def _get_input_word_from_ibocr_word(ibocr_word: Dict) -> InputWord:
@@ -34,6 +34,11 @@ def generate_doc_from_ibocr(raw_json: Any, name: str) -> Document:
   assert(isinstance(blob['metadata_list'], list))
   layouts = blob['metadata_list']
   assert layouts
+  y_offsets = (0, *itertools.accumulate(
+    layout['layout']['height'] for layout in layouts))
+  ibocr_words_by_page: DefaultDict[Any, List[Dict]] = defaultdict(list)
+  for ibocr_word in itertools.chain.from_iterable(blob['lines']):
+    ibocr_words_by_page[ibocr_word['page']].append(ibocr_word)
 
   def prepare_input_page(page_number: int) -> InputPage:
     # This is all hacky.
@@ -41,10 +46,8 @@ def generate_doc_from_ibocr(raw_json: Any, name: str) -> Document:
     assert isinstance(page_layout['layout']['width'], (int, float))
     assert isinstance(page_layout['layout']['height'], (int, float))
     input_words = tuple(map(
-      _get_input_word_from_ibocr_word,
-      filter(lambda ibocr_word: ibocr_word['page'] == page_number,
-        itertools.chain.from_iterable(blob['lines']))))
-    y_offset = sum(layouts[i]['layout']['height'] for i in range(page_number))
+      _get_input_word_from_ibocr_word, ibocr_words_by_page[page_number]))
+    y_offset = y_offsets[page_number]
     page = Page(
       BBox(
         Interval(0, page_layout['layout']['width']),
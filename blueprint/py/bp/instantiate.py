@@ -1,12 +1,51 @@
 """Private code for file format modules."""
 
 import dataclasses
+import functools
 import typing
 
 
 T = typing.TypeVar('T')
 
 
+# These are provided in `typing` in Python 3.8.
+def _get_args(t: typing.Type) -> typing.Tuple[type, ...]:
+  return getattr(t, '__args__', tuple())
+
+
+def _get_origin(t: typing.Type) -> typing.Optional[type]:
+  return getattr(t, '__origin__', None)
+
+
+# These may not be part of the official API...
+_KT = typing.KT # type: ignore
+_VT = typing.VT # type: ignore
+
+
+def _get_forward_arg(t: typing.ForwardRef) -> str: # type: ignore
+  return t.__forward_arg__
+
+
+def _is_optional(t: typing.Type[T]) -> bool:
+  return (_get_origin(t) is typing.Union and # type: ignore
+          len(_get_args(t)) == 2 and # type: ignore
+          type(None) in _get_args(t)) # type: ignore
+
+
+def _get_optional_arg(t: typing.Type[T]) -> typing.Type:
+  assert _is_optional(t)
+  for subtype in _get_args(t): # type: ignore
+    if subtype is not type(None):
+      return subtype
+  assert False
+
+
+@functools.lru_cache(maxsize=None)
+def _field_types(t: typing.Type) -> typing.Dict[str, typing.Type]:
+  """The field types of a dataclass, which instantiate looks up per value."""
+  return {field.name: field.type for field in dataclasses.fields(t)}
+
+
 def instantiate(t: typing.Type[T], v: typing.Any,
                  forward_ref_resolver:
                    typing.Optional[
@@ -20,7 +59,7 @@ def instantiate(t: typing.Type[T], v: typing.Any,
   The intended use of this is to load the contents of a JSON file into an
   immutable statically-typed Python object.
 
-  This function may get copy-pasted directly into Python files defining JSON
+  This module may get copy-pasted directly into Python files defining JSON
   schemas -- if you want to use its functionality you should probably make your
   own copy, too.
 
@@ -66,29 +105,6 @@ def instantiate(t: typing.Type[T], v: typing.Any,
   assert base_classes and     derived_class_resolver or \
      not base_classes and not derived_class_resolver
 
-  # These are provided in `typing` in Python 3.8.
-  def get_args(t: typing.Type) -> typing.Tuple[type, ...]:
-    return getattr(t, '__args__', tuple())
-  def get_origin(t: typing.Type) -> typing.Optional[type]:
-    return getattr(t, '__origin__', None)
-  # These may not be part of the official API...
-  KT = typing.KT # type: ignore
-  VT = typing.VT # type: ignore
-  def get_forward_arg(t: typing.ForwardRef) -> str: # type: ignore
-    return t.__forward_arg__
-
-  def is_optional(t: typing.Type[T]) -> bool:
-    return (get_origin(t) is typing.Union and # type: ignore
-            len(get_args(t)) == 2 and # type: ignore
-            type(None) in get_args(t)) # type: ignore
-
-  def get_optional_arg(t: typing.Type[T]) -> typing.Type:
-    assert is_optional(t)
-    for subtype in get_args(t): # type: ignore
-      if subtype is not type(None):
-        return subtype
-    assert False
-
   if base_classes:
     assert derived_class_resolver
     if t in base_classes:
@@ -98,41 +114,41 @@ def instantiate(t: typing.Type[T], v: typing.Any,
     if not isinstance(v, dict):
       raise RuntimeError('dataclasses must be instantiated from dicts; '
         f'error instantiating {t} from {v}')
-    types = {field.name: field.type for field in dataclasses.fields(t)}
+    types = _field_types(t)
     return t(**{key: instantiate( # type: ignore
         types[key], value, FRR, base_classes, derived_class_resolver)
       for key, value in v.items()})
 
-  elif get_origin(t) == list:
+  elif _get_origin(t) == list:
     if not isinstance(v, list):
       raise RuntimeError('lists must be instantiated from lists; '
         f'error instantiating {t} from {v}')
     return list(instantiate( # type: ignore
-        get_args(t)[0], entry, FRR, base_classes, derived_class_resolver)
+        _get_args(t)[0], entry, FRR, base_classes, derived_class_resolver)
       for entry in v)
 
-  elif get_origin(t) == tuple:
+  elif _get_origin(t) == tuple:
     if not isinstance(v, list):
       raise RuntimeError('tuples must be instantiated from lists; '
         f'error instantiating {t} from {v}')
     return tuple(instantiate( # type: ignore
-        get_args(t)[0], entry, FRR, base_classes, derived_class_resolver)
+        _get_args(t)[0], entry, FRR, base_classes, derived_class_resolver)
       for entry in v)
 
-  elif is_optional(t):
+  elif _is_optional(t):
     return None if v is None else instantiate( # type: ignore
-      get_optional_arg(t), v, FRR, base_classes, derived_class_resolver)
+      _get_optional_arg(t), v, FRR, base_classes, derived_class_resolver)
 
-  elif get_origin(t) == dict:
+  elif _get_origin(t) == dict:
     if not isinstance(v, dict):
       raise RuntimeError('dicts must be instantiated from dicts; '
         f'error instantiating {t} from {v}')
 
-    if (get_args(t) != (KT, VT) and # typing.Dict with no args, Python <  3.9
-        get_args(t) != tuple()):    # ditto,                           >= 3.9
+    if (_get_args(t) != (_KT, _VT) and # typing.Dict with no args, Python <  3.9
+        _get_args(t) != tuple()):      # ditto,                           >= 3.9
 
-      assert len(get_args(t)) == 2 # type: ignore
-      key_type, value_type = get_args(t) # type: ignore
+      assert len(_get_args(t)) == 2 # type: ignore
+      key_type, value_type = _get_args(t) # type: ignore
       if not key_type in {int, float, str}:
         raise RuntimeError(f'invalid key type in dict: {key_type} in {t}')
       return dict(**{key_type(key): instantiate( # type: ignore
@@ -142,14 +158,34 @@ def instantiate(t: typing.Type[T], v: typing.Any,
       return v # type: ignore
 
   elif isinstance(t, typing.ForwardRef): # type: ignore
-    t_name = get_forward_arg(t)
+    t_name = _get_forward_arg(t)
     if FRR and t_name in FRR:
       return instantiate(
         FRR[t_name], v, FRR, base_classes, derived_class_resolver)
     else:
       raise RuntimeError(
         'you need to provide instantiate with a dictionary to resolve '
-        f'types which are forward references (for "{get_forward_arg(t)}")')
+        f'types which are forward references (for "{_get_forward_arg(t)}")')
 
   else:
     return t(v) # type: ignore
+
+
+def to_json_value(v: typing.Any) -> typing.Any:
+  """Map a tree of dataclasses to raw JSON-serializable values.
+
+  This is the inverse of `instantiate`, and gives the same result as
+  `dataclasses.asdict` for the types `instantiate` supports, without deep-copying
+  every leaf value along the way.
+  """
+  if v is None or isinstance(v, (str, int, float)):
+    return v
+  elif dataclasses.is_dataclass(v) and not isinstance(v, type):
+    return {name: to_json_value(getattr(v, name))
+      for name in _field_types(type(v))} # type: ignore
+  elif isinstance(v, (list, tuple)):
+    return [to_json_value(entry) for entry in v]
+  elif isinstance(v, dict):
+    return {key: to_json_value(value) for key, value in v.items()}
+  else:
+    return v
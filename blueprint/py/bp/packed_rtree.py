@@ -0,0 +1,127 @@
+"""A static, bulk-loaded spatial index.
+
+EZBox supports interleaved insertions and queries, at the cost of a Python
+object (and a set of straddlers) per node. When all items are known up front,
+a packed R-tree is cheaper to build and to query: items are sorted along a
+Hilbert curve, grouped into runs of `node_size` leaves, and each level of
+bounding boxes is stored in flat coordinate arrays. This is the same layout as
+the Flatbush library.
+"""
+
+from array import array
+from typing import Callable, Generator, Generic, Iterable, List, TypeVar
+
+from .geometry import BBox
+
+T = TypeVar('T')
+
+_HILBERT_ORDER = 16
+_HILBERT_MAX = (1 << _HILBERT_ORDER) - 1
+
+
+def _hilbert_index(x: int, y: int) -> int:
+  """The position of (x, y) along a Hilbert curve filling the square
+  [0, 2^16) x [0, 2^16)."""
+  n = 1 << _HILBERT_ORDER
+  d = 0
+  s = n >> 1
+  while s:
+    rx = 1 if x & s else 0
+    ry = 1 if y & s else 0
+    d += s * s * ((3 * rx) ^ ry)
+    if not ry:
+      if rx:
+        x, y = n - 1 - x, n - 1 - y
+      x, y = y, x
+    s >>= 1
+  return d
+
+
+class PackedRTree(Generic[T]):
+  """An immutable R-tree over a fixed collection of items.
+
+  Node i < len(items) is the leaf for the i-th item in Hilbert order; the
+  remaining nodes are internal, stored level by level with the root last.
+  """
+
+  def __init__(
+      self,
+      ts: Iterable[T],
+      bbox_getter: Callable[[T], BBox],
+      node_size: int = 16):
+    items = list(ts)
+    bboxes = [bbox_getter(t) for t in items]
+    num_items = len(items)
+
+    order: List[int] = list(range(num_items))
+    if num_items > node_size:
+      min_x = min(bbox.ix.a for bbox in bboxes)
+      min_y = min(bbox.iy.a for bbox in bboxes)
+      width = max(bbox.ix.b for bbox in bboxes) - min_x or 1
+      height = max(bbox.iy.b for bbox in bboxes) - min_y or 1
+      hilbert_indices = [
+        _hilbert_index(
+          int(_HILBERT_MAX * ((bbox.ix.a + bbox.ix.b) / 2 - min_x) / width),
+          int(_HILBERT_MAX * ((bbox.iy.a + bbox.iy.b) / 2 - min_y) / height))
+        for bbox in bboxes]
+      order.sort(key=hilbert_indices.__getitem__)
+
+    self._items = [items[i] for i in order]
+    self._min_xs = array('d', (bboxes[i].ix.a for i in order))
+    self._min_ys = array('d', (bboxes[i].iy.a for i in order))
+    self._max_xs = array('d', (bboxes[i].ix.b for i in order))
+    self._max_ys = array('d', (bboxes[i].iy.b for i in order))
+    # The children of internal node num_items + k are the nodes in
+    # range(self._child_starts[k], self._child_ends[k]).
+    self._child_starts = array('q')
+    self._child_ends = array('q')
+
+    level_start, level_end = 0, num_items
+    while level_end - level_start > 1:
+      for start in range(level_start, level_end, node_size):
+        end = min(start + node_size, level_end)
+        self._child_starts.append(start)
+        self._child_ends.append(end)
+        self._min_xs.append(min(self._min_xs[start:end]))
+        self._min_ys.append(min(self._min_ys[start:end]))
+        self._max_xs.append(max(self._max_xs[start:end]))
+        self._max_ys.append(max(self._max_ys[start:end]))
+      level_start, level_end = level_end, len(self._min_xs)
+
+  def __len__(self) -> int:
+    return len(self._items)
+
+  def ts(self) -> Generator[T, None, None]:
+    yield from self._items
+
+  def ts_contained_in(self, bbox: BBox) -> Generator[T, None, None]:
+    return self._search(bbox, True)
+
+  def ts_intersecting(self, bbox: BBox) -> Generator[T, None, None]:
+    return self._search(bbox, False)
+
+  def _search(
+      self, bbox: BBox, contained: bool) -> Generator[T, None, None]:
+    if not self._items:
+      return
+    qx0, qx1, qy0, qy1 = bbox.ix.a, bbox.ix.b, bbox.iy.a, bbox.iy.b
+    items = self._items
+    child_starts, child_ends = self._child_starts, self._child_ends
+    min_xs, min_ys = self._min_xs, self._min_ys
+    max_xs, max_ys = self._max_xs, self._max_ys
+    num_items = len(items)
+
+    stack = [len(min_xs) - 1]
+    while stack:
+      node = stack.pop()
+      if max_xs[node] < qx0 or qx1 < min_xs[node] \
+          or max_ys[node] < qy0 or qy1 < min_ys[node]:
+        continue
+      if node < num_items:
+        if not contained or (
+            qx0 <= min_xs[node] and max_xs[node] <= qx1
+            and qy0 <= min_ys[node] and max_ys[node] <= qy1):
+          yield items[node]
+      else:
+        k = node - num_items
+        stack.extend(range(child_starts[k], child_ends[k]))
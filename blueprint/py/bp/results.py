@@ -60,7 +60,7 @@ def generate_results(root: Optional[BoundNode], runtime_info: DocRuntimeInfo) \
     assert bound_node.best_extraction is not None
     return ResultsNode(
       node_uuid=bound_node.uuid,
-      top_20_extractions=tuple(sorted(bound_node.returned_extractions)),
+      top_20_extractions=bound_node.top_extractions,
       top_score=bound_node.best_extraction.score,
       fields=tuple(bound_node.legal_fields),
       child_nodes=tuple(generate_results_tree(child)
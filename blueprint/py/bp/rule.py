@@ -367,4 +367,4 @@ def get_atoms(rule: Rule) -> FrozenSet[Atom]:
 
 
 def rule_is_decidable(rule: Rule, extraction: Extraction) -> bool:
-  return extraction.fields.issuperset(frozenset(rule.fields))
+  return extraction.fields.issuperset(rule.fields)
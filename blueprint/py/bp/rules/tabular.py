@@ -102,9 +102,7 @@ def _immediate_header(doc: Document, E1: Entity, E2: Entity) \
           E1.bbox.ix,
           E2.bbox.ix]) \
             .eroded(IMPINGEMENT_LARGE_INSET * doc.median_line_height()),
-      Interval.spanning([
-        E1.bbox.iy.a,
-        E2.bbox.iy.a]) \
+      Interval.of_pair(E1.bbox.iy.a, E2.bbox.iy.a) \
           .eroded(0.33 * doc.median_line_height())))
 
 
@@ -5,6 +5,7 @@ import re
 from bisect import bisect
 from dataclasses import dataclass
 from enum import auto, Flag
+from functools import lru_cache
 from typing import Any, Dict, List, Optional, Tuple
 from uuid import uuid4
 
@@ -46,6 +47,14 @@ def _text_comparison_massage(
   return s
 
 
+@lru_cache(maxsize=4096)
+def _massaged_pattern(
+    text_comparison_flags: TextComparisonFlags, text: str) -> str:
+  """_text_comparison_massage for a rule's own texts, which recur on every
+  score call."""
+  return _text_comparison_massage(text_comparison_flags, text)
+
+
 def _taper_error(raw_error: int, tolerance: int, taper: int) -> float:
   assert raw_error >= 0
   assert tolerance >= 0
@@ -252,6 +261,8 @@ class TextEquals(Degree1Predicate):
     E_text = _text_comparison_massage(self.text_comparison_flags, E_text)
 
     def match_score(text: str) -> float:
+      if text == E_text:
+        return 1.0
       if abs(len(text) - len(E_text)) > self.tolerance + self.taper:
         return 0
       error = sa_edit_distance(text, E_text)
@@ -259,7 +270,7 @@ class TextEquals(Degree1Predicate):
 
     best: Optional[float] = None
     for text in self.texts:
-      text = _text_comparison_massage(self.text_comparison_flags, text)
+      text = _massaged_pattern(self.text_comparison_flags, text)
       this_match_score = match_score(text)
       if best is None or best < this_match_score:
         best = this_match_score
@@ -281,6 +292,9 @@ def text_is_one_of(
   return TextEquals(texts, text_comparison_flags, tolerance, taper)
 
 
+# Predicates compare by identity and are immutable, so identical text_equals
+# predicates can safely be shared rather than rebuilt for every field.
+@lru_cache(maxsize=1024)
 def text_equals(
     text: str,
     text_comparison_flags: TextComparisonFlags = TextComparisonFlags.NONE,
@@ -50,6 +50,11 @@ def run_model(doc: Document, root: Node, config: Config=Config()) \
       bp_logging.info('Pumping extraction tree')
       runtime_tracker.start(Step.PUMPING)
       def done() -> bool:
+        if config.stop_on_first_nonempty \
+            and bound_root.best_extraction is not None \
+            and not bound_root.best_extraction.is_empty \
+            and bound_root.best_extraction.score > 0:
+          return True
         if config.num_samples < 0:
           return False
         else:
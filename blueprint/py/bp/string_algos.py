@@ -21,24 +21,25 @@ def edit_distance(s1: str, s2: str) -> int:
   if not s2:
     return len(s1)
 
-  M = [[0 for _ in range(len(s2) + 1)] for _ in range(len(s1) + 1)]
-  # M[i1][i2] is the edit distance between s1[:i1] and s2[:i2].
-  for i1 in range(len(s1) + 1):
-    M[i1][0] = i1
-  for i2 in range(len(s2) + 1):
-    M[0][i2] = i2
-
-  for i1 in range(1, len(s1) + 1):
-    for i2 in range(1, len(s2) + 1):
-      cost = 0 if s1[i1 - 1] == s2[i2 - 1] else 1
-      M[i1][i2] = min(
-          [
-              1 + M[i1 - 1][i2],
-              1 + M[i1][i2 - 1],
-              cost + M[i1 - 1][i2 - 1],
-          ])
-
-  return M[len(s1)][len(s2)]
+  # Only the previous row of the DP table is needed to compute the next one.
+  # prev[i2] is the edit distance between s1[:i1 - 1] and s2[:i2], and cur[i2]
+  # the edit distance between s1[:i1] and s2[:i2].
+  prev = list(range(len(s2) + 1))
+  for i1, c1 in enumerate(s1, 1):
+    cur = [i1]
+    left = i1
+    for i2, c2 in enumerate(s2, 1):
+      diagonal = prev[i2 - 1] if c1 == c2 else prev[i2 - 1] + 1
+      up = prev[i2] + 1
+      left += 1
+      if up < left:
+        left = up
+      if diagonal < left:
+        left = diagonal
+      cur.append(left)
+    prev = cur
+
+  return prev[-1]
 
 
 def relative_edit_distance(s1: str, s2: str) -> float:
@@ -5,7 +5,7 @@ from uuid import uuid4
 
 from ..synthesis.rules import find_spatial_rules
 
-from ..document import DocRegion, Document, EZDocRegion
+from ..document import DocRegion, Document, PackedDocRegion
 from ..entity import Entity, Page, Text, Word
 from ..extraction import Extraction, ExtractionPoint, Field
 from ..functional import arg_max, pairs
@@ -58,9 +58,9 @@ def generate_target_extraction(
     doc_region = DocRegion.build(document, entity.bbox)
     assert doc_region
     return doc_region
-  ez_doc_region: EZDocRegion[Entity] = EZDocRegion(build_doc_region)
-  for entity in filter(lambda E: not isinstance(E, Page), document.entities):
-    ez_doc_region.insert(entity)
+  ez_doc_region: PackedDocRegion[Entity] = PackedDocRegion(
+    filter(lambda E: not isinstance(E, Page), document.entities),
+    build_doc_region)
   extraction_points = tuple(find_entity(assignment.field, assignment.value)
     for assignment in targets.assignments)
   if any(point is None for point in extraction_points):
@@ -128,7 +128,7 @@ class Node:
 
   def is_decidable(self, rule: Rule) -> bool:
     """Can this rule be checked at this node?"""
-    return frozenset(rule.fields) <= self.legal_fields
+    return self.legal_fields.issuperset(rule.fields)
 
   def all_rules(self) -> Generator[Rule, None, None]:
     """Yields the rules at this node and all descendant nodes."""
@@ -16,7 +16,28 @@ python3 -m unittest unit_tests/*.py
 echo "Ok unit tests"
 
 echo "Checking integration tests"
-python3 -m unittest integration_tests/*.py
+# The integration test modules are independent, so run each one in its own
+# process. Each module logs to its own file, which is printed only if that
+# module fails. Every module is waited for before reporting a failure.
+log_dir="$(mktemp -d)"
+trap 'rm -rf "$log_dir"' EXIT
+test_modules=(integration_tests/test_*.py)
+pids=()
+for test_module in "${test_modules[@]}"; do
+  python3 -m unittest "$test_module" > "$log_dir/$(basename "$test_module").log" 2>&1 &
+  pids+=($!)
+done
+status=0
+for i in "${!pids[@]}"; do
+  if ! wait "${pids[$i]}"; then
+    echo "FAILED ${test_modules[$i]}:"
+    cat "$log_dir/$(basename "${test_modules[$i]}").log"
+    status=1
+  fi
+done
+if [ "$status" -ne 0 ]; then
+  exit "$status"
+fi
 echo "Ok integration tests"
 
 echo "ALL TESTS PASSED"
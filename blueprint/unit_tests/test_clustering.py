@@ -0,0 +1,18 @@
+from unittest import TestCase
+
+from bp.entity import Text, Word
+from bp.entity_gen.clustering import sort_word_cluster
+from bp.geometry import BBox, Interval
+
+
+class TestClustering(TestCase):
+
+  def test_sort_word_cluster(self) -> None:
+    def word(text: str, x: float, y: float) -> Text:
+      return Text.from_words(
+        (Word(BBox(Interval(x, x + 1), Interval(y, y + 1)), text),))
+    cluster = [
+      word('d', 2, 2.05), word('b', 2, 0), word('c', 0, 2),
+      word('a', 0, 0.05), word('e', 1, 4)]
+    lines = [[W.text for W in line] for line in sort_word_cluster(cluster)]
+    self.assertEqual(lines, [['a', 'b'], ['c', 'd'], ['e']])
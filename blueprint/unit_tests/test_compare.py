@@ -0,0 +1,34 @@
+import copy
+import pickle
+
+from unittest import TestCase
+
+from bp.compare import Cluster, Row, draw_table, tabulate
+
+
+class TestCompare(TestCase):
+
+  def test_tabulate(self) -> None:
+    self.assertEqual(
+      tabulate([('a', 'bbb', None), ('cc', 1, 'd'), ('eeeee',)]),
+      'a   bbb   \n'
+      'cc  1    d\n'
+      'eeeee')
+
+  def test_tabulate_empty(self) -> None:
+    self.assertEqual(tabulate([]), '')
+    self.assertEqual(tabulate([(), ()]), '')
+
+  def test_draw_table(self) -> None:
+    self.assertEqual(
+      draw_table([('name', 'ms'), ('a', '12345')]),
+      'name    ms\n'
+      'a    12345\n')
+    with self.assertRaises(ValueError):
+      draw_table([('a', 'b'), ('c',)])
+
+  def test_pickle_and_deepcopy_round_trip(self) -> None:
+    cluster = Cluster(
+      (('doc name', 'a'),), (Row('targets', {'x': '1'}),), {'x': True})
+    self.assertEqual(pickle.loads(pickle.dumps(cluster)), cluster)
+    self.assertEqual(copy.deepcopy(cluster), cluster)
@@ -0,0 +1,65 @@
+import copy
+import pickle
+
+from typing import Any, Callable
+from unittest import TestCase
+
+from bp.document import DocRegion, Document
+from bp.entity import Text, Word
+from bp.geometry import BBox, Interval
+
+
+class TestDocument(TestCase):
+
+  def test_doc_region_intersect_two(self) -> None:
+    document = Document(BBox(Interval(0, 10), Interval(0, 10)), (), 'doc')
+    boxes = (
+      BBox(Interval(0, 4), Interval(0, 4)),
+      BBox(Interval(1, 5), Interval(2, 3)),
+      BBox(Interval(4, 6), Interval(1, 2)),
+      BBox(Interval(5, 6), Interval(0, 4)))
+    for b1 in boxes:
+      for b2 in boxes:
+        dr1, dr2 = DocRegion(document, b1), DocRegion(document, b2)
+        self.assertEqual(DocRegion.intersect_two(dr1, dr2),
+          DocRegion.intersection([dr1, dr2]))
+    self.assertIsNone(
+      DocRegion.intersect_two(None, DocRegion(document, boxes[0])))
+
+  def test_pickle_and_deepcopy_round_trip(self) -> None:
+    words = (
+      Word(BBox(Interval(0, 2), Interval(0, 1)), 'hello'),
+      Word(BBox(Interval(3, 5), Interval(0, 1)), 'world'))
+    text = Text.from_words(words, maximality_score=0.5)
+    document = Document.from_entities(words + (text,), 'doc')
+    # Populate the caches, which are not part of the saved state.
+    text.entity_words()
+    document.filter_entities(Word)
+    doc_region = DocRegion(document, BBox(Interval(0, 3), Interval(0, 1)))
+
+    def check(round_trip: Callable[[Any], Any]) -> None:
+      word_copy = round_trip(words[0])
+      self.assertEqual(
+        (word_copy.bbox, word_copy.type, word_copy.text, word_copy.origin),
+        (words[0].bbox, 'Word', 'hello', None))
+
+      text_copy = round_trip(text)
+      self.assertEqual(text_copy.text, 'hello world')
+      self.assertEqual(text_copy.maximality_score, 0.5)
+      self.assertEqual(
+        [w.text for w in text_copy.entity_words()], ['hello', 'world'])
+
+      document_copy = round_trip(document)
+      self.assertEqual(document_copy.name, 'doc')
+      self.assertEqual(document_copy.bbox, document.bbox)
+      self.assertEqual(
+        [w.text for w in document_copy.filter_entities(Word)],
+        ['hello', 'world'])
+      self.assertEqual(len(document_copy.filter_entities(Text)), 1)
+
+      doc_region_copy = round_trip(doc_region)
+      self.assertEqual(doc_region_copy.bbox, doc_region.bbox)
+      self.assertEqual(doc_region_copy.document.name, 'doc')
+
+    check(lambda x: pickle.loads(pickle.dumps(x)))
+    check(copy.deepcopy)
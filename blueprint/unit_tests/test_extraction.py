@@ -0,0 +1,42 @@
+import copy
+import pickle
+
+from unittest import TestCase
+
+from bp.entity import Word
+from bp.extraction import Extraction, ExtractionPoint, OverlappingFieldsError
+from bp.geometry import BBox, Interval
+
+
+class TestExtraction(TestCase):
+
+  def test_merge(self) -> None:
+    bbox = BBox(Interval(0, 1), Interval(0, 1))
+    w1, w2, w3 = Word(bbox, 'a'), Word(bbox, 'b'), Word(bbox, 'c')
+    e1 = Extraction((ExtractionPoint('x', w1), ExtractionPoint('y', w2)))
+    e2 = Extraction((ExtractionPoint('z', w3),))
+    merged = Extraction.merge((e1, e2, Extraction(())))
+    self.assertEqual(merged.fields, frozenset(('x', 'y', 'z')))
+    self.assertTrue('z' in merged)
+    self.assertFalse('w' in merged)
+    self.assertIs(merged['y'], w2)
+    with self.assertRaises(OverlappingFieldsError):
+      Extraction.merge(
+        (e1, Extraction((ExtractionPoint('y', w3),))))
+
+  def test_pickle_and_deepcopy_round_trip(self) -> None:
+    bbox = BBox(Interval(0, 1), Interval(0, 1))
+    extraction = Extraction(
+      (ExtractionPoint('x', Word(bbox, 'a')),
+       ExtractionPoint('y', Word(bbox, 'b'))))
+    # Populate the caches, which are not part of the saved state.
+    self.assertEqual(extraction.fields, frozenset(('x', 'y')))
+
+    for extraction_copy in (
+        pickle.loads(pickle.dumps(extraction)), copy.deepcopy(extraction)):
+      self.assertEqual(
+        [(point.field, point.entity.entity_text)
+          for point in extraction_copy.assignments],
+        [('x', 'a'), ('y', 'b')])
+      self.assertEqual(extraction_copy.fields, frozenset(('x', 'y')))
+      self.assertEqual(extraction_copy['y'].entity_text, 'b')
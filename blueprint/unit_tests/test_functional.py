@@ -23,3 +23,22 @@ class TestFunctional(TestCase):
       all_equal(
         explode() if i == 2 else i
         for i in range(3)))
+
+  def test_multiplicities(self) -> None:
+    self.assertEqual(
+      multiplicities(['a', 'b', 'a', 'c', 'a']), {'a': 3, 'b': 1, 'c': 1})
+    self.assertEqual(multiplicities([]), {})
+    self.assertEqual(
+      repeated_elements(['a', 'b', 'a', 'c', 'b']), frozenset(('a', 'b')))
+    self.assertEqual(repeated_elements(['a', 'b']), frozenset())
+
+  def test_arg_max_and_arg_min(self) -> None:
+    words = ['bb', 'a', 'cc', 'ddd', 'eee', 'f']
+    self.assertEqual(arg_max(len, words), 'ddd')
+    self.assertEqual(arg_min(len, words), 'a')
+    self.assertEqual(arg_max(len, iter(words)), 'ddd')
+    self.assertEqual(arg_min(len, (w for w in words)), 'a')
+    with self.assertRaises(ValueError):
+      arg_max(len, [])
+    with self.assertRaises(ValueError):
+      arg_min(len, iter([]))
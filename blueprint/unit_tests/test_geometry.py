@@ -0,0 +1,35 @@
+from unittest import TestCase
+
+from bp.geometry import BBox, Interval
+
+
+class TestGeometry(TestCase):
+
+  def test_bbox_intersection(self) -> None:
+    b1 = BBox(Interval(0, 4), Interval(0, 4))
+    b2 = BBox(Interval(1, 5), Interval(2, 3))
+    b3 = BBox(Interval(2, 6), Interval(-1, 10))
+    self.assertEqual(BBox.intersection([b1, b2, b3]),
+      BBox(Interval(2, 4), Interval(2, 3)))
+    self.assertEqual(BBox.intersection([b1]), b1)
+    self.assertIsNone(BBox.intersection([]))
+    self.assertIsNone(BBox.intersection(
+      [b1, BBox(Interval(5, 6), Interval(0, 4))]))
+    # Touching boxes intersect in a degenerate box.
+    self.assertEqual(
+      BBox.intersection([b1, BBox(Interval(4, 6), Interval(1, 2))]),
+      BBox(Interval(4, 4), Interval(1, 2)))
+
+  def test_interval_of_pair(self) -> None:
+    self.assertEqual(Interval.of_pair(3, 1), Interval(1, 3))
+    self.assertEqual(Interval.of_pair(1, 3), Interval.spanning([1, 3]))
+    self.assertEqual(Interval.of_pair(2, 2), Interval(2, 2))
+
+  def test_bbox_union(self) -> None:
+    b1 = BBox(Interval(0, 4), Interval(1, 4))
+    b2 = BBox(Interval(1, 5), Interval(2, 3))
+    b3 = BBox(Interval(2, 6), Interval(-1, 2))
+    self.assertEqual(BBox.union([b1, b2, b3]),
+      BBox(Interval(0, 6), Interval(-1, 4)))
+    self.assertEqual(BBox.union(iter([b2])), b2)
+    self.assertIsNone(BBox.union([]))
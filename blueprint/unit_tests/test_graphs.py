@@ -0,0 +1,62 @@
+from unittest import TestCase
+
+from bp.graphs import Graph, WeightedMultiGraph, components
+
+
+class TestGraphs(TestCase):
+
+  def test_degrees(self) -> None:
+    graph: Graph[str] = Graph(
+      frozenset('abcd'),
+      frozenset((('a', 'b'), ('b', 'a'), ('a', 'c'), ('c', 'c'))))
+    self.assertEqual(
+      [graph.degree(v) for v in 'abcd'], [3, 2, 2, 0])
+    self.assertEqual(
+      [graph.indegree(v) for v in 'abcd'], [1, 1, 2, 0])
+    self.assertEqual(
+      [graph.outdegree(v) for v in 'abcd'], [2, 1, 1, 0])
+    self.assertEqual(graph.maximum_vertex_degree, 3)
+    self.assertEqual(graph.neighbors('a'), frozenset('bc'))
+    self.assertEqual(graph.neighbors('c'), frozenset('a'))
+    self.assertEqual(graph.neighbors('d'), frozenset())
+    self.assertEqual(
+      graph, Graph(graph.vertices, frozenset(graph.edges)))
+
+  def test_weighted_degrees(self) -> None:
+    graph: WeightedMultiGraph[str] = WeightedMultiGraph(
+      frozenset('abc'),
+      frozenset((('a', 'b'), ('b', 'c'))),
+      {('a', 'b'): (1.0, 2.0), ('b', 'c'): (0.5,)})
+    self.assertEqual(
+      [graph.degree(v) for v in 'abc'], [2, 3, 1])
+    self.assertEqual(
+      [graph.indegree(v) for v in 'abc'], [0, 2, 1])
+    self.assertEqual(
+      [graph.outdegree(v) for v in 'abc'], [2, 1, 0])
+
+  def test_weighted_collapse_and_removal(self) -> None:
+    graph: WeightedMultiGraph[str] = WeightedMultiGraph(
+      frozenset('abcd'),
+      frozenset((('a', 'c'), ('b', 'c'), ('c', 'd'))),
+      {('a', 'c'): (1.0,), ('b', 'c'): (2.0,), ('c', 'd'): (3.0,)})
+
+    collapsed = graph.with_vertices_collapsed('ab', 'x')
+    self.assertEqual(collapsed.vertices, frozenset('cdx'))
+    self.assertEqual(collapsed.edges, frozenset((('x', 'c'), ('c', 'd'))))
+    self.assertEqual(sorted(collapsed.weights[('x', 'c')]), [1.0, 2.0])
+    self.assertEqual(collapsed.degree('c'), 3)
+
+    removed = graph.with_vertices_removed('d')
+    self.assertEqual(removed.edges, frozenset((('a', 'c'), ('b', 'c'))))
+    self.assertEqual(frozenset(removed.weights), removed.edges)
+
+    restricted = graph.restricted_to(frozenset('bcd'))
+    self.assertEqual(restricted.edges, frozenset((('b', 'c'), ('c', 'd'))))
+    self.assertEqual(frozenset(restricted.weights), restricted.edges)
+
+  def test_components(self) -> None:
+    self.assertEqual(components([]), frozenset())
+    self.assertEqual(
+      components([(1, 2), (), (3,), (4, 5, 6), (2, 7), (6, 8), (7, 1)]),
+      frozenset((
+        frozenset((1, 2, 7)), frozenset((3,)), frozenset((4, 5, 6, 8)))))
@@ -0,0 +1,65 @@
+from random import Random
+from typing import Callable, List, Sequence, Union
+from unittest import TestCase
+
+from bp.ez_box import EZBox
+from bp.geometry import BBox, Interval
+from bp.packed_rtree import PackedRTree
+
+
+SpatialIndex = Union[EZBox[int], PackedRTree[int]]
+
+
+def random_bbox(random: Random, extent: float) -> BBox:
+  x0, x1 = sorted(random.uniform(0, extent) for _ in range(2))
+  y0, y1 = sorted(random.uniform(0, extent) for _ in range(2))
+  return BBox(Interval(x0, x1), Interval(y0, y1))
+
+
+def build_ez_box(bboxes: Sequence[BBox]) -> EZBox[int]:
+  ez_box: EZBox[int] = EZBox(
+    BBox(Interval(0, 100), Interval(0, 100)), lambda i: bboxes[i])
+  for i in range(len(bboxes)):
+    ez_box.insert(i)
+  return ez_box
+
+
+def build_packed_rtree(bboxes: Sequence[BBox]) -> PackedRTree[int]:
+  return PackedRTree(range(len(bboxes)), lambda i: bboxes[i])
+
+
+class TestSpatialIndex(TestCase):
+
+  def test_queries_match_brute_force(self) -> None:
+    builders: List[Callable[[Sequence[BBox]], SpatialIndex]] = [
+      build_ez_box, build_packed_rtree]
+    for build in builders:
+      random = Random(0)
+      for num_items in (0, 1, 16, 17, 500):
+        with self.subTest(index=build.__name__, num_items=num_items):
+          bboxes = [random_bbox(random, 100) for _ in range(num_items)]
+          index = build(bboxes)
+          self.assertEqual(sorted(index.ts()), list(range(num_items)))
+
+          queries = [random_bbox(random, 100) for _ in range(50)]
+          queries.append(BBox(Interval(-10, 110), Interval(-10, 110)))
+          for query in queries:
+            self.assertEqual(
+              sorted(index.ts_contained_in(query)),
+              [i for i, bbox in enumerate(bboxes)
+                if query.contains_bbox(bbox)])
+            self.assertEqual(
+              sorted(index.ts_intersecting(query)),
+              [i for i, bbox in enumerate(bboxes)
+                if query.intersects_bbox(bbox)])
+
+  def test_ez_box_ts_yields_each_item_once_in_preorder(self) -> None:
+    random = Random(1)
+    ez_box = build_ez_box([random_bbox(random, 100) for _ in range(200)])
+
+    def preorder(node: EZBox[int]) -> List[int]:
+      return list(node.straddlers) + [
+        t for child in node.child_nodes for t in preorder(child)]
+
+    self.assertEqual(list(ez_box.ts()), preorder(ez_box))
+    self.assertEqual(sorted(ez_box.ts()), list(range(200)))
@@ -5,6 +5,13 @@ from bp.string_algos import *
 
 class TestStringAlgos(TestCase):
 
+  def test_edit_distance(self) -> None:
+    self.assertEqual(3, edit_distance("kitten", "sitting"))
+    self.assertEqual(0, edit_distance("abc", "abc"))
+    self.assertEqual(3, edit_distance("", "abc"))
+    self.assertEqual(3, edit_distance("abc", ""))
+    self.assertEqual(6, edit_distance("99-JAN-99", "JAN-99-99"))
+
   def test_substring_edit_distance(self) -> None:
     self.assertEqual(2, substring_edit_distance("abcdefg", "aaa"))
     self.assertEqual(0, substring_edit_distance("abcdefg", "def"))
@@ -0,0 +1,27 @@
+from unittest import TestCase
+
+from bp.entity_gen.type_scoring import date_likeness, dollar_amount_likeness
+
+
+class TestTypeScoring(TestCase):
+
+  def test_date_likeness(self) -> None:
+    score, scores = date_likeness('September 03, 2021')
+    self.assertEqual(score, 1)
+    self.assertEqual(scores['JAN-99-99'], 1)
+    self.assertEqual(date_likeness('12/31/2019')[1]['99-99-99'], 1)
+    self.assertEqual(date_likeness('05.06.21')[1]['99-99-99'], 1)
+    self.assertEqual(date_likeness('04th May 2020')[1]['99TH-JAN-99'], 1)
+    self.assertEqual(date_likeness('03MAR21')[1]['99JAN99'], 1)
+    self.assertLess(date_likeness('Gross Pay')[0], 0.5)
+    self.assertEqual(
+      date_likeness('This text is much too long to be a date'),
+      (0, {'text_too_long': True}))
+
+  def test_dollar_amount_likeness(self) -> None:
+    self.assertEqual(dollar_amount_likeness('$1,234.56'), 1.0)
+    self.assertEqual(dollar_amount_likeness('.00'), 1)
+    self.assertEqual(dollar_amount_likeness('12'), 0)
+    self.assertEqual(dollar_amount_likeness('Gross Pay'), 0.0)
+    self.assertGreater(
+      dollar_amount_likeness('1,234.56'), dollar_amount_likeness('x1,234.56'))